@@ -14,7 +14,7 @@ import time
 import threading
 from typing import Dict, Any, Optional, List, Callable
 
-from app.utils.java_utils import is_java_installed
+from app.utils.java_utils import is_java_installed, get_java_version
 from app.utils.memory_utils import get_memory_info, calculate_recommended_memory
 
 
@@ -47,6 +47,12 @@ class MinecraftInstance:
         if not java_installed:
             logging.warning("Java not found. Minecraft may not launch correctly.")
             return False
+            
+        java_version = get_java_version()
+        if java_version:
+            logging.info(f"Java version: {java_version}")
+        else:
+            logging.warning("Java is installed but version could not be determined")
         return True
         
     def get_versions(self) -> List[str]:
@@ -8,13 +8,14 @@ Minecraft version management and download for the Minecraft Modpack Launcher.
 import os
 import json
 import logging
-import hashlib
 import requests
 import tempfile
 import platform
 import time
 from typing import Dict, Any, Optional, List, Tuple
 
+from app.utils.file_utils import download_file, download_files_batch
+
 # Minecraft version manifest URL
 VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
 
@@ -241,9 +242,10 @@ class MinecraftDownloader:
                     assets_data = json.load(f)
                     
                 objects = assets_data.get("objects", {})
-                total_objects = len(objects)
-                downloaded_objects = 0
                 
+                # Queue the assets that aren't on disk yet
+                asset_downloads = []
+                asset_names = {}
                 for asset_path, asset_info in objects.items():
                     # Get asset hash
                     asset_hash = asset_info.get("hash")
@@ -254,25 +256,24 @@ class MinecraftDownloader:
                     hash_prefix = asset_hash[:2]
                     asset_object_path = os.path.join(self.assets_dir, "objects", hash_prefix, asset_hash)
                     
-                    # Skip if already exists
-                    if os.path.exists(asset_object_path):
-                        downloaded_objects += 1
-                        if progress_callback:
-                            progress = 0.3 + (downloaded_objects / total_objects) * 0.3
-                            progress_callback(progress, f"Downloading assets ({downloaded_objects}/{total_objects})...")
+                    # Skip if already exists or queued; identical assets share one object
+                    if os.path.exists(asset_object_path) or asset_object_path in asset_names:
                         continue
                         
-                    # Download asset
                     asset_url = f"https://resources.download.minecraft.net/{hash_prefix}/{asset_hash}"
-                    os.makedirs(os.path.dirname(asset_object_path), exist_ok=True)
+                    asset_downloads.append((asset_url, asset_object_path, asset_hash))
+                    asset_names[asset_object_path] = asset_path
                     
-                    if not self._download_file(asset_url, asset_object_path, asset_hash):
-                        logging.warning(f"Failed to download asset {asset_path}")
-                        
-                    downloaded_objects += 1
+                def report_assets(completed, total):
                     if progress_callback:
-                        progress = 0.3 + (downloaded_objects / total_objects) * 0.3
-                        progress_callback(progress, f"Downloading assets ({downloaded_objects}/{total_objects})...")
+                        progress = 0.3 + (completed / total) * 0.3
+                        progress_callback(progress, f"Downloading assets ({completed}/{total})...")
+                        
+                # Download assets concurrently over pooled connections
+                results = download_files_batch(asset_downloads, "sha1", report_assets)
+                for asset_object_path, success in results.items():
+                    if not success:
+                        logging.warning(f"Failed to download asset {asset_names[asset_object_path]}")
                         
             except Exception as e:
                 logging.error(f"Failed to process assets: {e}")
@@ -283,13 +284,14 @@ class MinecraftDownloader:
             progress_callback(0.6, "Downloading libraries...")
             
         libraries = version_info.get("libraries", [])
-        total_libraries = len(libraries)
-        downloaded_libraries = 0
+        
+        # Queue the artifacts and natives for this OS that aren't on disk yet
+        library_downloads = []
+        library_names = {}
         
         for library in libraries:
             # Check if library is for current OS
             if not self._should_download_library(library):
-                downloaded_libraries += 1
                 continue
                 
             # Get download info
@@ -303,11 +305,10 @@ class MinecraftDownloader:
                 
                 if path and url:
                     library_path = os.path.join(self.libraries_dir, path)
-                    os.makedirs(os.path.dirname(library_path), exist_ok=True)
                     
-                    if not os.path.exists(library_path):
-                        if not self._download_file(url, library_path, sha1):
-                            logging.warning(f"Failed to download library {path}")
+                    if not os.path.exists(library_path) and library_path not in library_names:
+                        library_downloads.append((url, library_path, sha1))
+                        library_names[library_path] = f"library {path}"
                             
             # Get OS-specific classifiers
             classifiers = downloads.get("classifiers", {})
@@ -332,16 +333,21 @@ class MinecraftDownloader:
                     
                     if path and url:
                         native_path = os.path.join(self.libraries_dir, path)
-                        os.makedirs(os.path.dirname(native_path), exist_ok=True)
                         
-                        if not os.path.exists(native_path):
-                            if not self._download_file(url, native_path, sha1):
-                                logging.warning(f"Failed to download native library {path}")
-                                
-            downloaded_libraries += 1
+                        if not os.path.exists(native_path) and native_path not in library_names:
+                            library_downloads.append((url, native_path, sha1))
+                            library_names[native_path] = f"native library {path}"
+                            
+        def report_libraries(completed, total):
             if progress_callback:
-                progress = 0.6 + (downloaded_libraries / total_libraries) * 0.4
-                progress_callback(progress, f"Downloading libraries ({downloaded_libraries}/{total_libraries})...")
+                progress = 0.6 + (completed / total) * 0.4
+                progress_callback(progress, f"Downloading libraries ({completed}/{total})...")
+                
+        # Download libraries concurrently over pooled connections
+        results = download_files_batch(library_downloads, "sha1", report_libraries)
+        for library_path, success in results.items():
+            if not success:
+                logging.warning(f"Failed to download {library_names[library_path]}")
                 
         if progress_callback:
             progress_callback(1.0, "Download complete")
@@ -409,75 +415,5 @@ class MinecraftDownloader:
         Returns:
             bool: True if download was successful, False otherwise.
         """
-        # Skip if file already exists and hash matches
-        if os.path.exists(path) and expected_hash:
-            file_hash = self._calculate_hash(path, hash_algorithm)
-            if file_hash and file_hash.lower() == expected_hash.lower():
-                return True
-                
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        
-        try:
-            # Download file
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            with open(path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        
-            # Verify hash if provided
-            if expected_hash:
-                file_hash = self._calculate_hash(path, hash_algorithm)
-                if not file_hash or file_hash.lower() != expected_hash.lower():
-                    logging.warning(f"Hash mismatch for {path}")
-                    logging.warning(f"Expected: {expected_hash}")
-                    logging.warning(f"Got: {file_hash}")
-                    os.remove(path)
-                    return False
-                    
-            return True
-            
-        except Exception as e:
-            logging.error(f"Failed to download {url}: {e}")
-            
-            # Clean up partial download
-            if os.path.exists(path):
-                os.remove(path)
-                
-            return False
-            
-    def _calculate_hash(self, file_path: str, algorithm: str = "sha1") -> Optional[str]:
-        """Calculate file hash.
-        
-        Args:
-            file_path (str): Path to file.
-            algorithm (str): Hash algorithm.
-            
-        Returns:
-            Optional[str]: Calculated hash or None if error.
-        """
-        try:
-            hash_obj = None
-            
-            if algorithm.lower() == "sha1":
-                hash_obj = hashlib.sha1()
-            elif algorithm.lower() == "sha256":
-                hash_obj = hashlib.sha256()
-            elif algorithm.lower() == "md5":
-                hash_obj = hashlib.md5()
-            else:
-                logging.error(f"Unsupported hash algorithm: {algorithm}")
-                return None
-                
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    hash_obj.update(byte_block)
-                    
-            return hash_obj.hexdigest()
-            
-        except Exception as e:
-            logging.error(f"Failed to calculate hash for {file_path}: {e}")
-            return None
\ No newline at end of file
+        # Skips a matching existing file, resumes partial downloads and verifies the result
+        return download_file(url, path, expected_hash=expected_hash, hash_algorithm=hash_algorithm)
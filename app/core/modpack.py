@@ -16,6 +16,7 @@ from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Any
 
 from app.core.mods import Mod, ModManager
+from app.utils.file_utils import extract_zip
 
 
 @dataclass
@@ -115,8 +116,8 @@ class ModpackManager:
         try:
             # Extract modpack to temporary directory
             with tempfile.TemporaryDirectory() as temp_dir:
-                with zipfile.ZipFile(modpack_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
+                if not extract_zip(modpack_path, temp_dir):
+                    return None
                     
                 # Look for manifest.json
                 manifest_path = os.path.join(temp_dir, "manifest.json")
@@ -9,11 +9,12 @@ import os
 import json
 import logging
 import hashlib
-import requests
 import concurrent.futures
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Any, Set
 
+from app.utils.file_utils import download_file
+
 
 @dataclass
 class Mod:
@@ -133,19 +134,11 @@ class ModManager:
         try:
             logging.info(f"Downloading mod {mod.name} from {mod.download_url}")
             
-            # Download file with progress reporting
-            response = requests.get(mod.download_url, stream=True)
-            response.raise_for_status()
-            
-            # Get content length if available
-            total_size = int(response.headers.get('content-length', 0))
-            mod.file_size = total_size
-            
-            # Download file
-            with open(target_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            # Download over the shared session; a failed download is kept for resuming
+            if not download_file(mod.download_url, target_path):
+                return False
+                
+            mod.file_size = os.path.getsize(target_path)
             
             # Calculate file hash
             if not mod.file_hash:
@@ -13,11 +13,13 @@ import requests
 import tempfile
 import platform
 import time
+import threading
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 
 from app.core.modpack import Modpack
 from app.core.mods import Mod
+from app.utils.file_utils import calculate_checksum, download_file
 
 
 @dataclass
@@ -55,6 +57,8 @@ class RepositoryManager:
         self.repositories = self._load_repositories()
         self.cache_dir = os.path.join("data", "cache", "repositories")
         os.makedirs(self.cache_dir, exist_ok=True)
+        # Repositories may be updated from several worker threads at once
+        self._save_lock = threading.Lock()
         
     def _load_repositories(self) -> Dict[str, Repository]:
         """Load repositories from configuration.
@@ -98,20 +102,21 @@ class RepositoryManager:
         
     def _save_repositories(self):
         """Save repositories to configuration."""
-        repo_data = {}
-        
-        for repo_id, repo in self.repositories.items():
-            repo_data[repo_id] = {
-                "name": repo.name,
-                "url": repo.url,
-                "enabled": repo.enabled,
-                "auth_token": repo.auth_token,
-                "last_updated": repo.last_updated,
-                "modpacks": repo.modpacks
-            }
+        with self._save_lock:
+            repo_data = {}
             
-        self.config.set("repositories", repo_data)
-        self.config.save()
+            for repo_id, repo in self.repositories.items():
+                repo_data[repo_id] = {
+                    "name": repo.name,
+                    "url": repo.url,
+                    "enabled": repo.enabled,
+                    "auth_token": repo.auth_token,
+                    "last_updated": repo.last_updated,
+                    "modpacks": repo.modpacks
+                }
+                
+            self.config.set("repositories", repo_data)
+            self.config.save()
         
     def add_repository(self, name: str, url: str) -> bool:
         """Add a repository.
@@ -400,35 +405,14 @@ class RepositoryManager:
             if repo.auth_token:
                 headers["Authorization"] = f"Bearer {repo.auth_token}"
                 
-            # Download file with progress reporting
-            response = requests.get(download_url, headers=headers, stream=True)
-            response.raise_for_status()
-            
-            # Get content length if available
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-            
-            # Ensure target directory exists
-            os.makedirs(os.path.dirname(target_path), exist_ok=True)
-            
-            # Download file
-            with open(target_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        
-                        if progress_callback and total_size > 0:
-                            progress = downloaded_size / total_size
-                            progress_callback(progress)
-                            
-            if progress_callback:
-                progress_callback(1.0)  # 100% complete
+            # Download file with progress reporting; a failed download is kept for resuming
+            if not download_file(download_url, target_path, progress_callback, headers=headers):
+                logging.error(f"Failed to download modpack {modpack_details.get('name', modpack_id)}")
+                return False
                 
             # Verify hash if provided
             file_hash = modpack_details.get("file_hash")
             if file_hash:
-                from app.utils import calculate_checksum
                 actual_hash = calculate_checksum(target_path, "sha256")
                 
                 if actual_hash != file_hash:
@@ -449,6 +433,23 @@ class RepositoryManager:
                 
             return False
     
+    def get_modpack_icon_url(self, repo_id: str, modpack_id: str) -> Optional[str]:
+        """Get the icon URL for a modpack.
+        
+        Args:
+            repo_id (str): Repository ID.
+            modpack_id (str): Modpack ID.
+            
+        Returns:
+            Optional[str]: Icon URL or None if repository not found.
+        """
+        repo = self.repositories.get(repo_id)
+        
+        if not repo:
+            return None
+            
+        return f"{repo.url}/api/modpacks/{modpack_id}/icon"
+        
     def get_modpack_icon(self, repo_id: str, modpack_id: str, target_path: str) -> bool:
         """Download modpack icon.
         
@@ -467,7 +468,7 @@ class RepositoryManager:
             return False
             
         # Build icon URL
-        icon_url = f"{repo.url}/api/modpacks/{modpack_id}/icon"
+        icon_url = self.get_modpack_icon_url(repo_id, modpack_id)
         
         try:
             # Download icon
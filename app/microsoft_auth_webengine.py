@@ -8,7 +8,6 @@ from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QLineEdit
 from PyQt6.QtCore import QUrl, QTimer
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEngineProfile
-from app.utils.minecraft_utils import get_player_head
 from msal import PublicClientApplication, SerializableTokenCache
 
 class BrowserAuthDialog(QDialog):
@@ -100,8 +99,12 @@ class BrowserAuthDialog(QDialog):
                 self.reject()
 
 class MicrosoftAuthManager:
+    # How long a fetched Minecraft profile is reused for the same access token
+    PROFILE_CACHE_TTL = 10 * 60
+
     def __init__(self, config=None):
         self.config = config
+        self._profile_cache = None  # (expiry timestamp, access token, profile)
         
         # Use Minecraft's official client ID - properly formatted (this is likely the issue)
         self.client_id = "389b1b32-b5d5-43b2-bddc-84ce938d6737"  # More reliable client ID
@@ -226,6 +229,12 @@ class MicrosoftAuthManager:
     
     def get_minecraft_profile(self):
         """Fetch the Minecraft profile with username and UUID."""
+        access_token = self.tokens.get("access_token") if self.tokens else None
+        cached = self._profile_cache
+        if cached and access_token and cached[1] == access_token and time.time() < cached[0]:
+            logging.debug("Using cached Minecraft profile")
+            return dict(cached[2])
+
         try:
             profile = self._get_minecraft_profile_data()
             if not profile:
@@ -246,18 +255,15 @@ class MicrosoftAuthManager:
                 
             logging.info(f"Successfully retrieved Minecraft profile: {username} ({player_uuid})")
             
-            # Get avatar if available
-            try:
-                avatar = get_player_head(uuid=player_uuid)
-            except Exception as avatar_error:
-                logging.error(f"Failed to get avatar: {avatar_error}")
-                avatar = None
-            
-            return {
+            # The avatar is loaded separately by the UI, since this may run
+            # off the GUI thread where QPixmap cannot be created
+            result = {
                 'name': username,
-                'id': player_uuid,
-                'avatar': avatar
+                'id': player_uuid
             }
+            if access_token:
+                self._profile_cache = (time.time() + self.PROFILE_CACHE_TTL, access_token, result)
+            return dict(result)
         except Exception as e:
             logging.error(f"Error fetching Minecraft profile: {e}")
             logging.exception("Full exception details:")
@@ -11,6 +11,9 @@ import platform
 import subprocess
 import threading
 import time
+import hashlib
+import functools
+from collections import OrderedDict
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QComboBox, QListWidget,
@@ -18,14 +21,149 @@ from PyQt6.QtWidgets import (
     QSplitter, QStackedWidget, QTabWidget, QFileDialog,
     QMenu, QMenuBar, QScrollArea, QLineEdit, QApplication  # Added QApplication here
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QThread, pyqtSlot, QUrl
 from PyQt6.QtGui import QIcon, QPixmap, QImage, QColor, QPalette
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 from app.core.minecraft import MinecraftInstance
 from app.core.modpack import ModpackManager
 from app.core.repository import RepositoryManager
 from app.microsoft_auth_webengine import MicrosoftAuthManager
-from app.utils.minecraft_utils import get_player_head
+from app.utils.minecraft_utils import player_head_url
+
+# Decoded once at import; converted to a QPixmap on the GUI thread where shown
+_DEFAULT_AVATAR_IMAGE = QImage(os.path.join("app", "ui", "resources", "default_avatar.png"))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_modpack_icon(icon_path, mtime):
+    """Load a modpack icon scaled for list items, shared between items and list reloads.
+    
+    Args:
+        icon_path (str): Path to the icon file.
+        mtime (float): Modification time of the file, so a replaced icon is reloaded.
+        
+    Returns:
+        QPixmap: Scaled icon.
+    """
+    return QPixmap(icon_path).scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
+class AvatarCache:
+    """UUID-keyed cache of player head pixmaps, persisted as PNGs on disk."""
+
+    # Keep heads for 4 hours, in line with Mojang profile cache conventions
+    TTL = 4 * 60 * 60
+    # Most recently used heads kept decoded in memory
+    MAX_ENTRIES = 256
+
+    def __init__(self, cache_dir=None):
+        """Initialize avatar cache.
+
+        Args:
+            cache_dir (str, optional): Directory for cached PNG files.
+                Defaults to ./data/cache/heads.
+        """
+        self.cache_dir = cache_dir or os.path.join("data", "cache", "heads")
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def _key(uuid):
+        """Normalize a UUID so dashed and undashed forms share an entry."""
+        return str(uuid).replace("-", "").lower()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def _remember(self, key, timestamp, pixmap):
+        """Add an entry to the memory tier, evicting the least recently used."""
+        self._entries[key] = (timestamp, pixmap)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def get(self, uuid, max_age=TTL):
+        """Get a cached avatar.
+
+        Args:
+            uuid (str): Player UUID.
+            max_age (int): Maximum age of the cached entry in seconds.
+
+        Returns:
+            QPixmap: Cached avatar or None if missing or expired.
+        """
+        if not uuid:
+            return None
+
+        key = self._key(uuid)
+        now = time.time()
+
+        entry = self._entries.get(key)
+        if entry and now - entry[0] < max_age:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        # Fall back to the PNG persisted by a previous session
+        path = self._path(key)
+        try:
+            timestamp = os.path.getmtime(path)
+        except OSError:
+            return None
+
+        if now - timestamp >= max_age:
+            return None
+
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return None
+
+        self._remember(key, timestamp, pixmap)
+        return pixmap
+
+    def put(self, uuid, pixmap):
+        """Store an avatar in memory and on disk.
+
+        Args:
+            uuid (str): Player UUID.
+            pixmap (QPixmap): Avatar to cache.
+        """
+        if not uuid or pixmap is None or pixmap.isNull():
+            return
+
+        key = self._key(uuid)
+        self._remember(key, time.time(), pixmap)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pixmap.save(self._path(key), "PNG")
+        except Exception as e:
+            logging.warning(f"Failed to write avatar cache for {uuid}: {e}")
+
+
+class ProfileFetchThread(QThread):
+    """Thread for fetching the Minecraft profile without blocking the UI."""
+    
+    fetched = pyqtSignal(object)
+    
+    def __init__(self, auth_manager, parent=None):
+        """Initialize profile fetch thread.
+        
+        Args:
+            auth_manager: MicrosoftAuthManager instance.
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self.auth_manager = auth_manager
+        
+    def run(self):
+        """Fetch the profile and emit it, or None on failure."""
+        try:
+            profile = self.auth_manager.get_minecraft_profile()
+        except Exception as e:
+            logging.error(f"Error in profile thread: {e}")
+            profile = None
+            
+        self.fetched.emit(profile)
 
 
 class ModernButton(QPushButton):
@@ -110,6 +248,26 @@ class ModpackItem(QFrame):
     
     clicked = pyqtSignal(object)
     
+    # Shared by every item without its own icon, created on first use
+    _default_icon = None
+    
+    @classmethod
+    def default_icon(cls):
+        """Get the default modpack icon, decoded and scaled once."""
+        if cls._default_icon is None:
+            default_icon = os.path.join("app", "ui", "resources", "modpack_icon.png")
+            if os.path.exists(default_icon):
+                pixmap = QPixmap(default_icon)
+            else:
+                # Create a colored square as fallback
+                image = QImage(64, 64, QImage.Format.Format_ARGB32)
+                image.fill(QColor("#E61B72"))
+                pixmap = QPixmap.fromImage(image)
+                
+            cls._default_icon = pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            
+        return cls._default_icon
+    
     def __init__(self, modpack, parent=None):
         super().__init__(parent)
         self.modpack = modpack
@@ -126,7 +284,12 @@ class ModpackItem(QFrame):
                 background-color: #363D51;
             }
         """)
-        
+
+        # The frame paints a solid background, so Qt can skip repainting the
+        # parent underneath it while scrolling
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAutoFillBackground(True)
+
         # Layout
         layout = QHBoxLayout(self)
         layout.setContentsMargins(15, 10, 15, 10)
@@ -138,20 +301,13 @@ class ModpackItem(QFrame):
         # Try to load icon
         icon_path = modpack.icon_path
         if (icon_path and os.path.exists(icon_path)):
-            pixmap = QPixmap(icon_path)
+            pixmap = _load_modpack_icon(icon_path, os.path.getmtime(icon_path))
         else:
             # Use default icon
-            default_icon = os.path.join("app", "ui", "resources", "modpack_icon.png")
-            if os.path.exists(default_icon):
-                pixmap = QPixmap(default_icon)
-            else:
-                # Create a colored square as fallback
-                image = QImage(64, 64, QImage.Format.Format_ARGB32)
-                image.fill(QColor("#E61B72"))
-                pixmap = QPixmap.fromImage(image)
+            pixmap = self.default_icon()
         
         # Apply rounded corners to icon
-        icon_label.setPixmap(pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        icon_label.setPixmap(pixmap)
         icon_label.setStyleSheet("""
             border-radius: 8px;
             background-color: #232734;
@@ -167,7 +323,10 @@ class ModpackItem(QFrame):
         name_label.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
         info_layout.addWidget(name_label)
         
-        description_label = QLabel(modpack.description[:100] + "..." if len(modpack.description) > 100 else modpack.description)
+        description = modpack.description
+        if len(description) > 100:
+            description = f"{description[:100]}…"
+        description_label = QLabel(description)
         description_label.setStyleSheet("color: #BFC1C7; font-size: 13px;")
         description_label.setWordWrap(True)
         info_layout.addWidget(description_label)
@@ -739,8 +898,23 @@ class MainWindow(QMainWindow):
         self.minecraft = MinecraftInstance(config)
         self.username = ""
         self.session_token = ""
-        
+        self.avatar_cache = AvatarCache()
+        self._avatar_uuid = None
+        self._current_profile = None
+        # Digest of the downloaded head currently shown, to skip redundant decodes
+        self._current_avatar_hash = None
+        # Avatars are fetched on Qt's event-driven network stack
+        self._nam = QNetworkAccessManager(self)
+
         self.init_ui()
+        
+        # Converted and scaled to the avatar label once, shared by every fallback site
+        self._default_avatar_pixmap = QPixmap.fromImage(_DEFAULT_AVATAR_IMAGE).scaled(
+            self.avatar_label.size(),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        
         self.load_style()
         self.setup_microsoft_auth()
         
@@ -825,27 +999,14 @@ class MainWindow(QMainWindow):
         # Update username label
         self.username_label.setText(username)
 
-        # Try to get the player avatar
-        if hasattr(self.login_window, 'ms_auth') and self.login_window.ms_auth:
-            profile = self.login_window.ms_auth.get_minecraft_profile()
-            if profile:
-                # Log the profile data
-                logging.info(f"Fetched Minecraft profile: {profile}")
-
-                # Update username
-                self.username_label.setText(profile.get('name', 'Debug4'))
-
-                # Fetch and update avatar using get_player_head
-                avatar = get_player_head(uuid=profile.get('id'))
-                if avatar:
-                    self.avatar_label.setPixmap(avatar)
-                else:
-                    # Set default avatar if no avatar is available
-                    default_avatar = os.path.join("app", "ui", "resources", "default_avatar.png")
-                    if os.path.exists(default_avatar):
-                        self.avatar_label.setPixmap(QPixmap(default_avatar))
-            else:
-                logging.warning("Failed to fetch Minecraft profile.")
+        # Fetch the profile and avatar in the background, unless sign-in already did
+        if self._current_profile and self._current_profile.get('name') == username:
+            self.on_profile_fetched(self._current_profile)
+        elif hasattr(self.login_window, 'ms_auth') and self.login_window.ms_auth:
+            profile_thread = ProfileFetchThread(self.login_window.ms_auth, self)
+            profile_thread.fetched.connect(self.on_profile_fetched)
+            profile_thread.finished.connect(profile_thread.deleteLater)
+            profile_thread.start()
         else:
             logging.warning("Microsoft authentication object not found.")
 
@@ -858,10 +1019,101 @@ class MainWindow(QMainWindow):
         # Switch to modpack list screen
         self.stacked_widget.setCurrentIndex(1)
         
+    @pyqtSlot(object)
+    def on_profile_fetched(self, profile):
+        """Handle Minecraft profile fetched by ProfileFetchThread.
+        
+        Args:
+            profile (dict): Profile data or None if the fetch failed.
+        """
+        if not profile:
+            logging.warning("Failed to fetch Minecraft profile.")
+            return
+            
+        # Log the profile data
+        logging.info(f"Fetched Minecraft profile: {profile}")
+        
+        # Update username
+        self.username_label.setText(profile.get('name', 'Debug4'))
+        
+        # Fetch and update avatar
+        self.load_avatar(profile.get('id'))
+        
+    def load_avatar(self, uuid):
+        """Show the avatar for a player, downloading it in the background on a cache miss.
+        
+        Args:
+            uuid (str): Player UUID.
+        """
+        self._avatar_uuid = uuid
+        
+        avatar = self.avatar_cache.get(uuid)
+        if avatar is not None:
+            self._current_avatar_hash = None
+            self.avatar_label.setPixmap(avatar)
+            return
+            
+        reply = self._nam.get(QNetworkRequest(QUrl(player_head_url(uuid))))
+        reply.finished.connect(lambda: self.on_avatar_reply(uuid, reply))
+        
+    def on_avatar_reply(self, uuid, reply):
+        """Handle player head download completion.
+        
+        Args:
+            uuid (str): Player UUID.
+            reply (QNetworkReply): Finished network reply.
+        """
+        reply.deleteLater()
+        
+        # Ignore results for a player who is no longer shown
+        if uuid != self._avatar_uuid:
+            return
+            
+        image = QImage()
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            data = reply.readAll().data()
+            
+            # The same head is already on screen, skip decoding it again
+            avatar_hash = hashlib.md5(data).digest()
+            if avatar_hash == self._current_avatar_hash:
+                return
+                
+            image = QImage.fromData(data)
+            if not image.isNull():
+                self._current_avatar_hash = avatar_hash
+        else:
+            logging.warning(f"Failed to fetch avatar for {uuid}: {reply.errorString()}")
+            
+        if not image.isNull():
+            image = image.scaled(
+                self.avatar_label.size(),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            
+        self.on_avatar_fetched(uuid, image)
+        
+    def on_avatar_fetched(self, uuid, image):
+        """Show a fetched player head, or the default avatar if it is null.
+        
+        Args:
+            uuid (str): Player UUID.
+            image (QImage): Decoded head, null if the download failed.
+        """
+        if not image.isNull():
+            avatar = QPixmap.fromImage(image)
+            self.avatar_cache.put(uuid, avatar)
+            self.avatar_label.setPixmap(avatar)
+        elif not self._default_avatar_pixmap.isNull():
+            # Set default avatar if no avatar is available
+            self._current_avatar_hash = None
+            self.avatar_label.setPixmap(self._default_avatar_pixmap)
+        
     def on_logout(self):
         """Handle logout."""
         self.username = ""
         self.session_token = ""
+        self._current_profile = None
         
         # Switch to login screen
         self.stacked_widget.setCurrentIndex(0)
@@ -895,87 +1147,84 @@ class MainWindow(QMainWindow):
 
     def handle_microsoft_signin(self):
         """Handle Microsoft sign-in button click."""
+        # Disable the button while signing in
+        self.ms_signin_button.setEnabled(False)
+        self.ms_signin_button.setText("Signing in...")
+        
         try:
-            # Disable the button while signing in
-            self.ms_signin_button.setEnabled(False)
-            self.ms_signin_button.setText("Signing in...")
-            
             # Try to authenticate
-            if self.ms_auth.authenticate():
-                profile = self.ms_auth.get_minecraft_profile()
-                if profile:
-                    # Update UI to show logged-in state
-                    username = profile['name']
-                    self.username = username
-                    self.session_token = "ms_token"
-                    
-                    # Update the profile UI components
-                    self.username_label.setText(username)
-                    
-                    # Set the avatar if available
-                    if 'avatar' in profile and profile['avatar']:
-                        self.avatar_label.setPixmap(profile['avatar'])
-                    else:
-                        # Fallback to default avatar
-                        default_avatar = os.path.join("app", "ui", "resources", "default_avatar.png")
-                        self.avatar_label.setPixmap(QPixmap(default_avatar))
-                    
-                    # Store user info in config
-                    self.config.set("username", self.username)
-                    self.config.set("auth_type", "microsoft")
-                    self.config.save()
-                    
-                    # Show success message and proceed to main screen
-                    self.on_login_success(username, "ms_token")
-                else:
-                    QMessageBox.warning(self, "Sign In Failed", 
-                                      "Could not retrieve Minecraft profile.")
-            else:
+            if not self.ms_auth.authenticate():
                 # User may have cancelled, so don't show error message
-                pass
+                self.reset_signin_button()
+                return
+                
+            # Check if user owns the game
+            if not self.ms_auth.check_game_ownership():
+                QMessageBox.warning(self, "Game Ownership", 
+                                  "This Microsoft account does not own Minecraft.")
+                self.reset_signin_button()
+                return
+        except Exception as e:
+            logging.error(f"Microsoft authentication error: {e}")
+            QMessageBox.warning(self, "Authentication Error", 
+                              f"An error occurred during authentication: {str(e)}")
+            self.reset_signin_button()
+            return
+            
+        # Fetch the profile in the background; the button stays disabled until it arrives
+        profile_thread = ProfileFetchThread(self.ms_auth, self)
+        profile_thread.fetched.connect(self.on_signin_profile_fetched)
+        profile_thread.finished.connect(profile_thread.deleteLater)
+        profile_thread.start()
+        
+    @pyqtSlot(object)
+    def on_signin_profile_fetched(self, profile):
+        """Finish Microsoft sign-in once ProfileFetchThread has the profile.
+        
+        Args:
+            profile (dict): Profile data or None if the fetch failed.
+        """
+        try:
+            if not profile:
+                QMessageBox.warning(self, "Sign In Failed", 
+                                  "Could not retrieve Minecraft profile.")
+                return
+                
+            # Fetched once; on_login_success reuses it
+            self._current_profile = profile
+            
+            # Update UI to show logged-in state
+            username = profile['name']
+            self.username = username
+            self.session_token = "ms_token"
+            
+            # Store user info in config
+            self.config.set("username", self.username)
+            self.config.set("auth_type", "microsoft")
+            self.config.save()
+            
+            # Show the profile and avatar, then proceed to main screen
+            self.on_login_success(username, "ms_token")
         except Exception as e:
             logging.error(f"Microsoft authentication error: {e}")
             QMessageBox.warning(self, "Authentication Error", 
                               f"An error occurred during authentication: {str(e)}")
         finally:
-            # Re-enable the button regardless of outcome
-            self.ms_signin_button.setEnabled(True)
-            if not self.username:
-                self.ms_signin_button.setText("Sign in with Microsoft")
-
-    def setup_minecraft_auth(self):
-        self.ms_auth = MicrosoftAuthManager(self.config)
-        
-        self.ms_signin_button = QPushButton("Sign in with Microsoft")
-        self.ms_signin_button.clicked.connect(self.handle_microsoft_signin)
-        
-        # Add button to your layout
-        # self.some_layout.addWidget(self.ms_signin_button)
-
-    def handle_microsoft_signin(self):
-        if self.ms_auth.authenticate():
-            # Check if user owns the game
-            if self.ms_auth.check_game_ownership():
-                profile = self.ms_auth.get_minecraft_profile()
-                if profile:
-                    self.ms_signin_button.setText(f"Signed in as {profile['name']}")
-                    # Store profile info
-                    self.config.minecraft_profile = profile
-                    self.config.save()
-                    QMessageBox.information(self, "Success", f"Successfully signed in as {profile['name']}")
-                else:
-                    QMessageBox.warning(self, "Error", "Could not retrieve Minecraft profile.")
-            else:
-                QMessageBox.warning(self, "Game Ownership", "This Microsoft account does not own Minecraft.")
-        else:
-            QMessageBox.warning(self, "Sign In Failed", "Could not sign in with Microsoft account.")
+            self.reset_signin_button()
+            
+    def reset_signin_button(self):
+        """Re-enable the Microsoft sign-in button after a sign-in attempt."""
+        self.ms_signin_button.setEnabled(True)
+        if not self.username:
+            self.ms_signin_button.setText("Sign in with Microsoft")
 
     def update_user_profile(self, user_info):
         """Update the UI with user profile information"""
         if not user_info:
             # Default/fallback display
             self.username_label.setText("Player4")
-            self.avatar_label.setPixmap(QPixmap("app/ui/resources/default_avatar.png"))
+            self._current_avatar_hash = None
+            self.avatar_label.setPixmap(self._default_avatar_pixmap)
             return
         
         # Set username
@@ -984,11 +1233,12 @@ class MainWindow(QMainWindow):
         
         # Set avatar
         avatar = user_info.get('avatar')
+        self._current_avatar_hash = None
         if (avatar):
             self.avatar_label.setPixmap(avatar)
         else:
             # Fallback to default avatar
-            self.avatar_label.setPixmap(QPixmap("app/ui/resources/default_avatar.png"))
+            self.avatar_label.setPixmap(self._default_avatar_pixmap)
 
     def open_login_dialog(self):
         from app.ui.login_window import LoginWindow
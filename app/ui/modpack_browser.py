@@ -7,20 +7,223 @@ Modpack browser for the Minecraft Modpack Launcher.
 
 import os
 import logging
-import tempfile
+import time
+import hashlib
+import concurrent.futures
+from collections import OrderedDict
 from PyQt6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QLineEdit, QComboBox,
-    QListWidget, QListWidgetItem, QMessageBox,
+    QListWidget, QListWidgetItem, QListView, QMessageBox,
     QProgressBar, QFrame, QSplitter, QCheckBox,
     QTabWidget, QTextEdit, QSpacerItem, QSizePolicy,
     QFileDialog
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QThread, pyqtSlot, QDir
-from PyQt6.QtGui import QIcon, QPixmap, QFont
+from PyQt6.QtCore import (
+    Qt, QSize, pyqtSignal, QThread, pyqtSlot, QDir, QTimer,
+    QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QIcon, QPixmap, QFont, QImageReader
+
+
+class IconDownloadTask(QRunnable):
+    """Thread pool task for downloading a single icon."""
+    
+    def __init__(self, cache, url, repo_id, modpack_id, path):
+        """Initialize icon download task.
+        
+        Args:
+            cache: IconCache instance to notify.
+            url (str): Icon URL, used as the cache key.
+            repo_id (str): Repository ID.
+            modpack_id (str): Modpack ID.
+            path (str): Path to save downloaded icon.
+        """
+        super().__init__()
+        self.cache = cache
+        self.url = url
+        self.repo_id = repo_id
+        self.modpack_id = modpack_id
+        self.path = path
+        
+    def run(self):
+        """Download icon and notify the cache."""
+        success = False
+        part_path = f"{self.path}.part"
+        
+        try:
+            # A missing icon is reported as False, not an error
+            if self.cache.repo_manager.get_modpack_icon(self.repo_id, self.modpack_id, part_path):
+                os.replace(part_path, self.path)
+                success = True
+                
+        except Exception as e:
+            logging.warning(f"Failed to download icon {self.url}: {e}")
+            
+        self.cache.downloaded.emit(self.url, success)
+
+
+class IconCache(QObject):
+    """URL-keyed cache of modpack icons held in memory and on disk."""
+    
+    icon_loaded = pyqtSignal(str, QPixmap)
+    downloaded = pyqtSignal(str, bool)
+    
+    # Most recently used icons kept decoded in memory
+    MAX_ENTRIES = 256
+    # Seconds before a failed icon is tried again, so a timeout or offline start isn't permanent
+    MISSING_RETRY = 5 * 60
+    
+    def __init__(self, repo_manager, cache_dir, parent=None):
+        """Initialize icon cache.
+        
+        Args:
+            repo_manager: RepositoryManager instance used to download icons.
+            cache_dir (str): Launcher cache directory; icons go in its icons subdirectory.
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self.repo_manager = repo_manager
+        self.icon_dir = os.path.join(cache_dir, "icons")
+        os.makedirs(self.icon_dir, exist_ok=True)
+        
+        self._pixmaps = OrderedDict()
+        self._pending = set()
+        self._missing = {}
+        
+        self.downloaded.connect(self._on_downloaded)
+        
+    def _path(self, url):
+        return os.path.join(self.icon_dir, f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.png")
+        
+    def _remember(self, url, pixmap):
+        """Add an icon to the memory tier, evicting the least recently used."""
+        self._pixmaps[url] = pixmap
+        self._pixmaps.move_to_end(url)
+        while len(self._pixmaps) > self.MAX_ENTRIES:
+            self._pixmaps.popitem(last=False)
+        
+    def _load(self, url):
+        """Load an icon from disk into memory.
+        
+        Args:
+            url (str): Icon URL.
+            
+        Returns:
+            QPixmap: Loaded icon or None if not cached or unreadable.
+        """
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+            
+        # Reject broken files from the header alone before a full decode
+        reader = QImageReader(path)
+        reader.setDecideFormatFromContent(True)
+        if not reader.size().isValid():
+            logging.warning(f"Discarding unreadable cached icon {path}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+            
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return None
+            
+        self._remember(url, pixmap)
+        return pixmap
+        
+    def get(self, url, repo_id, modpack_id):
+        """Get an icon, starting a background download on a miss.
+        
+        Args:
+            url (str): Icon URL from RepositoryManager.get_modpack_icon_url.
+            repo_id (str): Repository ID.
+            modpack_id (str): Modpack ID.
+            
+        Returns:
+            QPixmap: Cached icon or None; icon_loaded is emitted once a missing icon arrives.
+        """
+        if not url:
+            return None
+            
+        failed_at = self._missing.get(url)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < self.MISSING_RETRY:
+                return None
+            del self._missing[url]
+            
+        pixmap = self._pixmaps.get(url)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(url)
+            return pixmap
+            
+        pixmap = self._load(url)
+        if pixmap is not None:
+            return pixmap
+            
+        if url not in self._pending:
+            self._pending.add(url)
+            QThreadPool.globalInstance().start(
+                IconDownloadTask(self, url, repo_id, modpack_id, self._path(url))
+            )
+            
+        return None
+        
+    @pyqtSlot(str, bool)
+    def _on_downloaded(self, url, success):
+        """Handle icon download completion.
+        
+        Args:
+            url (str): Icon URL.
+            success (bool): Whether download was successful.
+        """
+        self._pending.discard(url)
+        
+        pixmap = self._load(url) if success else None
+        if pixmap is None:
+            self._missing[url] = time.monotonic()
+            return
+            
+        self.icon_loaded.emit(url, pixmap)
+
 
-from app.core.repository import RepositoryManager
-from app.core.modpack import ModpackManager, Modpack
+class ModsListModel(QAbstractListModel):
+    """List model exposing a modpack's mods without per-row widget items."""
+    
+    def __init__(self, parent=None):
+        """Initialize mods list model.
+        
+        Args:
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self._mods = []
+        
+    def set_mods(self, mods):
+        """Replace the mods shown by the model.
+        
+        Args:
+            mods (list): Mod dictionaries from the repository.
+        """
+        self.beginResetModel()
+        self._mods = mods
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._mods)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+            
+        mod = self._mods[index.row()]
+        mod_name = mod.get("name", "Unknown Mod")
+        mod_version = mod.get("version", "Unknown Version")
+        return f"{mod_name} v{mod_version}"
 
 
 class DownloadThread(QThread):
@@ -29,31 +232,59 @@ class DownloadThread(QThread):
     progress = pyqtSignal(float)
     finished = pyqtSignal(bool, str)
     
-    def __init__(self, repo_manager, repo_id, modpack_id, target_path):
+    # Only report progress when it advances by this much, or after this many seconds
+    PROGRESS_STEP = 0.01
+    PROGRESS_INTERVAL = 0.1
+    
+    def __init__(self, repo_manager, repo_id, modpack_id, target_dir):
         """Initialize download thread.
         
         Args:
             repo_manager: RepositoryManager instance.
             repo_id (str): Repository ID.
             modpack_id (str): Modpack ID.
-            target_path (str): Path to save downloaded modpack.
+            target_dir (str): Cache directory to download the modpack into.
         """
         super().__init__()
         self.repo_manager = repo_manager
         self.repo_id = repo_id
         self.modpack_id = modpack_id
-        self.target_path = target_path
+        self.target_path = os.path.join(target_dir, "downloads", f"{modpack_id}.zip")
+        self._last_progress = 0.0
+        self._last_emit = 0.0
+        
+    def _report_progress(self, progress):
+        """Emit progress, dropping updates too small or too frequent to show.
         
+        Args:
+            progress (float): Progress value (0.0 to 1.0).
+        """
+        now = time.monotonic()
+        if (progress >= 1.0
+                or progress - self._last_progress >= self.PROGRESS_STEP
+                or now - self._last_emit >= self.PROGRESS_INTERVAL):
+            self._last_progress = progress
+            self._last_emit = now
+            self.progress.emit(progress)
+            
     def run(self):
         """Download modpack and emit results."""
+        # Download next to the final file so completing it is a rename, not a copy
+        part_path = f"{self.target_path}.part"
+        
         try:
             success = self.repo_manager.download_modpack(
                 self.repo_id, 
                 self.modpack_id, 
-                self.target_path,
-                self.progress.emit
+                part_path,
+                self._report_progress
             )
             
+            if success:
+                os.replace(part_path, self.target_path)
+            elif os.path.exists(part_path):
+                os.remove(part_path)
+                
             self.finished.emit(success, self.target_path)
             
         except Exception as e:
@@ -61,10 +292,61 @@ class DownloadThread(QThread):
             self.finished.emit(False, str(e))
 
 
+class RepoUpdateThread(QThread):
+    """Thread for updating repositories."""
+    
+    progress = pyqtSignal(str, bool)
+    finished = pyqtSignal(dict)
+    
+    # Repository fetches are I/O-bound, so they are run concurrently
+    MAX_WORKERS = 8
+    
+    def __init__(self, repo_manager):
+        """Initialize repository update thread.
+        
+        Args:
+            repo_manager: RepositoryManager instance.
+        """
+        super().__init__()
+        self.repo_manager = repo_manager
+        
+    def run(self):
+        """Update all repositories in parallel and emit results."""
+        results = {}
+        repo_ids = [
+            repo_id for repo_id, repo in self.repo_manager.repositories.items()
+            if repo.enabled and repo.needs_update
+        ]
+        
+        if repo_ids:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                future_to_repo = {
+                    executor.submit(self.repo_manager.update_repository, repo_id): repo_id
+                    for repo_id in repo_ids
+                }
+                
+                for future in concurrent.futures.as_completed(future_to_repo):
+                    repo_id = future_to_repo[future]
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        logging.error(f"Update of repository {repo_id} raised exception: {e}")
+                        success = False
+                        
+                    results[repo_id] = success
+                    self.progress.emit(repo_id, success)
+                    
+        self.finished.emit(results)
+
+
 class ModpackBrowserDialog(QDialog):
     """Dialog for browsing and installing modpacks."""
     
-    modpack_installed = pyqtSignal(Modpack)
+    # Emits the installed Modpack instance
+    modpack_installed = pyqtSignal(object)
+    
+    # Delay before searching after the query or version changes, in ms
+    SEARCH_DELAY = 250
     
     def __init__(self, config, repo_manager, modpack_manager, parent=None):
         """Initialize modpack browser dialog.
@@ -81,6 +363,17 @@ class ModpackBrowserDialog(QDialog):
         self.modpack_manager = modpack_manager
         self.selected_modpack = None
         self.download_thread = None
+        self.repo_thread = None
+        
+        # Modpack icons, and the list items waiting on each icon URL
+        self.icon_cache = IconCache(repo_manager, config.get("cache_dir", os.path.join("data", "cache")), self)
+        self.icon_cache.icon_loaded.connect(self.on_icon_loaded)
+        self._icon_items = {}
+        
+        # Coalesce bursts of keystrokes into a single search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.search_modpacks)
         
         self.init_ui()
         self.load_minecraft_versions()
@@ -120,6 +413,7 @@ class ModpackBrowserDialog(QDialog):
         # Repository selection
         repo_frame = QFrame()
         repo_layout = QHBoxLayout(repo_frame)
+        self.repo_layout = repo_layout
         
         repo_layout.addWidget(QLabel("Repositories:"))
         
@@ -197,7 +491,10 @@ class ModpackBrowserDialog(QDialog):
         mods_tab = QWidget()
         mods_layout = QVBoxLayout(mods_tab)
         
-        self.mods_list = QListWidget()
+        self.mods_model = ModsListModel(self)
+        self.mods_list = QListView()
+        self.mods_list.setUniformItemSizes(True)
+        self.mods_list.setModel(self.mods_model)
         mods_layout.addWidget(self.mods_list)
         
         self.detail_tabs.addTab(mods_tab, "Mods")
@@ -298,34 +595,69 @@ class ModpackBrowserDialog(QDialog):
             
     def update_repositories(self):
         """Update repository checkboxes and refresh modpacks."""
-        # Clear existing checkboxes
-        for checkbox in self.repo_checkboxes.values():
-            checkbox.setParent(None)
-            
-        self.repo_checkboxes = {}
+        repositories = self.repo_manager.repositories
+        current = set(self.repo_checkboxes)
+        target = set(repositories)
         
-        # Add checkboxes for repositories
-        repo_layout = self.findChild(QFrame, None, Qt.FindChildOption.FindDirectChildrenOnly).layout()
-        
-        # Find the position to insert checkboxes (after "Repositories:" label)
-        insert_pos = 1
-        
-        for repo_id, repo in self.repo_manager.repositories.items():
+        # Remove checkboxes for repositories that no longer exist
+        for repo_id in current - target:
+            self.repo_checkboxes.pop(repo_id).setParent(None)
+            
+        # Sync checkboxes for repositories that are still present
+        for repo_id in current & target:
+            repo = repositories[repo_id]
+            checkbox = self.repo_checkboxes[repo_id]
+            checkbox.blockSignals(True)
+            checkbox.setText(repo.name)
+            checkbox.setChecked(repo.enabled)
+            checkbox.blockSignals(False)
+            
+        # Add checkboxes for new repositories
+        # Insert after the "Repositories:" label and any existing checkboxes
+        insert_pos = 1 + len(self.repo_checkboxes)
+        
+        for repo_id, repo in repositories.items():
+            if repo_id in current:
+                continue
+                
             checkbox = QCheckBox(repo.name)
             checkbox.setChecked(repo.enabled)
             checkbox.stateChanged.connect(lambda state, r=repo_id: self.on_repo_toggled(r, state))
             
             self.repo_checkboxes[repo_id] = checkbox
-            repo_layout.insertWidget(insert_pos, checkbox)
+            self.repo_layout.insertWidget(insert_pos, checkbox)
             insert_pos += 1
             
         # Update repositories in background
         self.update_repo_btn.setEnabled(False)
         self.update_repo_btn.setText("Updating...")
         
-        # In a real implementation, this would be done in a separate thread
-        results = self.repo_manager.update_all_repositories()
+        self.repo_thread = RepoUpdateThread(self.repo_manager)
+        self.repo_thread.progress.connect(self.repository_updated)
+        self.repo_thread.finished.connect(self.repositories_updated)
+        self.repo_thread.start()
         
+    @pyqtSlot(str, bool)
+    def repository_updated(self, repo_id, success):
+        """Handle a single repository finishing its update.
+        
+        Args:
+            repo_id (str): Repository ID.
+            success (bool): Whether the update succeeded.
+        """
+        repo = self.repo_manager.get_repository(repo_id)
+        name = repo.name if repo else repo_id
+        self.status_label.setText(
+            f"Updated {name}" if success else f"Failed to update {name}"
+        )
+        
+    @pyqtSlot(dict)
+    def repositories_updated(self, results):
+        """Handle repository update completion.
+        
+        Args:
+            results (dict): Mapping of repository IDs to update success status.
+        """
         self.update_repo_btn.setEnabled(True)
         self.update_repo_btn.setText("Update")
         
@@ -350,8 +682,8 @@ class ModpackBrowserDialog(QDialog):
         Args:
             text (str): Search text.
         """
-        # Auto-search after typing
-        self.search_modpacks()
+        # Auto-search once typing pauses
+        self._search_timer.start(self.SEARCH_DELAY)
         
     def on_version_changed(self, index):
         """Handle version combo box change.
@@ -360,11 +692,15 @@ class ModpackBrowserDialog(QDialog):
             index (int): Selected index.
         """
         # Auto-search after changing version
-        self.search_modpacks()
+        self._search_timer.start(self.SEARCH_DELAY)
         
     def search_modpacks(self):
         """Search for modpacks and update the list."""
-        self.modpack_list.clear()
+        # A direct search supersedes any pending debounced one
+        self._search_timer.stop()
+        
+        self._icon_items = {}
+        self.modpack_list.setCurrentRow(-1)
         self.selected_modpack = None
         self.clear_modpack_details()
         
@@ -378,15 +714,47 @@ class ModpackBrowserDialog(QDialog):
         # Search for modpacks
         modpacks = self.repo_manager.search_modpacks(query, mc_version)
         
-        # Update list
-        for modpack in modpacks:
-            item = QListWidgetItem(modpack.get("name", "Unknown"))
-            item.setData(Qt.ItemDataRole.UserRole, modpack)
-            
-            # In a real implementation, load actual modpack icons
-            # item.setIcon(QIcon(modpack_icon_path))
+        # Update list without repainting after every insertion, reusing the
+        # items from the previous search instead of clearing and reallocating
+        user_role = Qt.ItemDataRole.UserRole
+        make_item = QListWidgetItem
+        no_icon = QIcon()
+        modpack_list = self.modpack_list
+        
+        sorting_enabled = modpack_list.isSortingEnabled()
+        modpack_list.setUpdatesEnabled(False)
+        modpack_list.setSortingEnabled(False)
+        try:
+            # Drop items beyond the new result count
+            while modpack_list.count() > len(modpacks):
+                modpack_list.takeItem(modpack_list.count() - 1)
+                
+            reused = modpack_list.count()
             
-            self.modpack_list.addItem(item)
+            for row, modpack in enumerate(modpacks):
+                if row < reused:
+                    item = modpack_list.item(row)
+                    item.setText(modpack.get("name", "Unknown"))
+                    item.setIcon(no_icon)
+                else:
+                    item = make_item(modpack.get("name", "Unknown"))
+                item.setData(user_role, modpack)
+                
+                # Show the cached icon, or fill it in when the download finishes
+                repo_id = modpack.get("repository", {}).get("id")
+                icon_url = self.repo_manager.get_modpack_icon_url(repo_id, modpack.get("id"))
+                if icon_url:
+                    pixmap = self.icon_cache.get(icon_url, repo_id, modpack.get("id"))
+                    if pixmap is not None:
+                        item.setIcon(QIcon(pixmap))
+                    else:
+                        self._icon_items.setdefault(icon_url, []).append(item)
+                
+                if row >= reused:
+                    modpack_list.addItem(item)
+        finally:
+            modpack_list.setSortingEnabled(sorting_enabled)
+            modpack_list.setUpdatesEnabled(True)
             
         # Update status
         if modpacks:
@@ -394,6 +762,18 @@ class ModpackBrowserDialog(QDialog):
         else:
             self.status_label.setText("No modpacks found")
             
+    @pyqtSlot(str, QPixmap)
+    def on_icon_loaded(self, url, pixmap):
+        """Set a downloaded icon on the list items that use it.
+        
+        Args:
+            url (str): Icon URL.
+            pixmap (QPixmap): Loaded icon.
+        """
+        icon = QIcon(pixmap)
+        for item in self._icon_items.pop(url, []):
+            item.setIcon(icon)
+            
     def on_modpack_selected(self, current, previous):
         """Handle modpack selection change.
         
@@ -418,12 +798,7 @@ class ModpackBrowserDialog(QDialog):
         self.description_text.setText(modpack_data.get("description", "No description available"))
         
         # Update mods list
-        self.mods_list.clear()
-        for mod in modpack_data.get("mods", []):
-            mod_name = mod.get("name", "Unknown Mod")
-            mod_version = mod.get("version", "Unknown Version")
-            item = QListWidgetItem(f"{mod_name} v{mod_version}")
-            self.mods_list.addItem(item)
+        self.mods_model.set_mods(modpack_data.get("mods", []))
             
         # Update screenshots (if available)
         # In a real implementation, load actual screenshots
@@ -437,7 +812,7 @@ class ModpackBrowserDialog(QDialog):
         self.author_label.setText("")
         self.versions_label.setText("")
         self.description_text.setText("")
-        self.mods_list.clear()
+        self.mods_model.set_mods([])
         self.install_btn.setEnabled(False)
         
     def install_modpack(self):
@@ -469,10 +844,6 @@ class ModpackBrowserDialog(QDialog):
         if result != QMessageBox.StandardButton.Yes:
             return
             
-        # Create temporary file for download
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp_file:
-            tmp_path = tmp_file.name
-            
         # Show progress
         self.progress_frame.setVisible(True)
         self.progress_label.setText(f"Downloading {modpack_name}...")
@@ -486,7 +857,7 @@ class ModpackBrowserDialog(QDialog):
             self.repo_manager,
             repo_id,
             modpack_id,
-            tmp_path
+            self.config.get("cache_dir", os.path.join("data", "cache"))
         )
         
         self.download_thread.progress.connect(self.update_progress)
@@ -524,11 +895,11 @@ class ModpackBrowserDialog(QDialog):
         # Install modpack
         modpack = self.modpack_manager.install_modpack(path_or_error)
         
-        # Clean up temporary file
+        # Clean up downloaded file
         try:
             os.remove(path_or_error)
         except Exception as e:
-            logging.warning(f"Failed to remove temporary file {path_or_error}: {e}")
+            logging.warning(f"Failed to remove downloaded file {path_or_error}: {e}")
             
         if modpack:
             QMessageBox.information(
@@ -6,26 +6,247 @@ Modpack manager UI component for the Minecraft Modpack Launcher.
 """
 
 import os
+import json
 import logging
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QTabWidget,
-    QListWidget, QListWidgetItem, QMessageBox, 
+    QListView, QMessageBox, 
     QProgressBar, QSplitter, QFrame, QFileDialog,
-    QTextEdit, QGroupBox, QFormLayout, QSpinBox
+    QTextEdit, QGroupBox, QFormLayout, QSpinBox,
+    QProgressDialog
+)
+from PyQt6.QtCore import (
+    Qt, QSize, pyqtSignal, pyqtSlot, QThread, QTimer, QFileSystemWatcher,
+    QAbstractListModel, QModelIndex
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap
 
 from app.core.modpack import Modpack
 from app.core.mods import Mod
 
 
+class ModView:
+    """Lightweight view of a mod dictionary with attribute access."""
+    
+    __slots__ = ("id", "name", "version", "description", "mc_versions", "dependencies")
+    
+    def __init__(self, mod_info):
+        """Initialize mod view.
+        
+        Args:
+            mod_info (dict): Mod dictionary from the modpack.
+        """
+        self.id = mod_info.get("id")
+        self.name = mod_info.get("name", "Unknown Mod")
+        self.version = mod_info.get("version", "Unknown")
+        self.description = mod_info.get("description")
+        self.mc_versions = mod_info.get("mc_versions", [])
+        self.dependencies = mod_info.get("dependencies", [])
+
+
+class ModListModel(QAbstractListModel):
+    """List model over a modpack's mods."""
+    
+    def __init__(self, parent=None):
+        """Initialize mod list model.
+        
+        Args:
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self._mods = []
+        
+    def set_mods(self, mods):
+        """Replace the mods shown by the model.
+        
+        Args:
+            mods (list): Mod dictionaries.
+        """
+        self.beginResetModel()
+        self._mods = [ModView(mod_info) for mod_info in mods]
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._mods)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        mod_info = self._mods[index.row()]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return mod_info.name
+        if role == Qt.ItemDataRole.UserRole:
+            return mod_info
+            
+        return None
+
+
+class FileListModel(QAbstractListModel):
+    """List model over (display name, file path) pairs."""
+    
+    def __init__(self, parent=None):
+        """Initialize file list model.
+        
+        Args:
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self._files = []
+        
+    def set_files(self, files):
+        """Replace the files shown by the model.
+        
+        Args:
+            files (list): (display name, file path) tuples.
+        """
+        self.beginResetModel()
+        self._files = files
+        self.endResetModel()
+        
+    def update_files(self, files):
+        """Change the files shown by the model, touching only rows that differ.
+        
+        Args:
+            files (list): (display name, file path) tuples, in display order.
+        """
+        new_files = set(files)
+        
+        # Nothing in common, e.g. another modpack; a single reset is cheaper
+        if new_files.isdisjoint(self._files):
+            self.set_files(files)
+            return
+            
+        for row in range(len(self._files) - 1, -1, -1):
+            if self._files[row] not in new_files:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._files[row]
+                self.endRemoveRows()
+                
+        old_files = set(self._files)
+        for row, file in enumerate(files):
+            if file not in old_files:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._files.insert(row, file)
+                self.endInsertRows()
+        
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._files)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        name, path = self._files[index.row()]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return name
+        if role == Qt.ItemDataRole.UserRole:
+            return path
+            
+        return None
+
+
+class ConfigScanThread(QThread):
+    """Thread for listing a modpack's config files."""
+    
+    scanned = pyqtSignal(str, list, dict)
+    
+    def __init__(self, config_dir, parent=None):
+        """Initialize config scan thread.
+        
+        Args:
+            config_dir (str): Config directory to scan.
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self.config_dir = config_dir
+        
+    def run(self):
+        """Walk the config directory and emit (relative path, path) pairs
+        along with the modification time of every directory walked."""
+        files = []
+        mtimes = {}
+        complete = True
+        stack = [self.config_dir]
+        
+        # scandir entries carry their type, avoiding a separate stat per entry
+        while stack:
+            # Stop early if the modpack was switched while scanning
+            if self.isInterruptionRequested():
+                return
+                
+            directory = stack.pop()
+            try:
+                # Taken before listing, so a change during the scan leaves the listing stale
+                mtimes[directory] = os.stat(directory).st_mtime
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append((os.path.relpath(entry.path, self.config_dir), entry.path))
+            except OSError as e:
+                logging.error(f"Error scanning configs in {directory}: {e}")
+                complete = False
+                
+        files.sort()
+            
+        # An incomplete walk is shown but not cached
+        self.scanned.emit(self.config_dir, files, mtimes if complete else {})
+
+
+class ModpackTaskThread(QThread):
+    """Thread for running a long modpack operation such as export or uninstall."""
+    
+    completed = pyqtSignal(bool)
+    
+    def __init__(self, task, *args, parent=None):
+        """Initialize modpack task thread.
+        
+        Args:
+            task: ModpackManager method to run, returning success.
+            *args: Arguments for the task.
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self.task = task
+        self.args = args
+        
+    def run(self):
+        """Run the task and emit whether it succeeded."""
+        try:
+            success = bool(self.task(*self.args))
+        except Exception as e:
+            logging.error(f"Error in modpack task thread: {e}")
+            success = False
+            
+        self.completed.emit(success)
+
+
 class ModpackManagerWidget(QWidget):
     """Widget for managing a modpack."""
     
     modpack_updated = pyqtSignal(Modpack)
     
+    # Rows laid out per event loop pass when a list is populated
+    LIST_BATCH_SIZE = 200
+    
+    # Files listed in the resource packs tab
+    RESOURCE_PACK_EXTENSIONS = (".zip", ".zip.disabled")
+    
+    # Delay before loading a selected modpack, so quick switches only load the last one, in ms
+    SELECT_DELAY = 120
+    
+    # Last config and resource pack listings, reused while every listed directory is unchanged
+    SCAN_CACHE_FILE = os.path.join("data", "cache", "modpack_scans.json")
+    
     def __init__(self, config, modpack_manager, parent=None):
         """Initialize modpack manager widget.
         
@@ -38,6 +259,31 @@ class ModpackManagerWidget(QWidget):
         self.config = config
         self.modpack_manager = modpack_manager
         self.modpack = None
+        self._config_dir = None
+        self._config_thread = None
+        self._mc_versions = frozenset()
+        
+        # Coalesce rapid modpack switches into a single load
+        self._pending_modpack = None
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(self.SELECT_DELAY)
+        self._select_timer.timeout.connect(self.apply_pending_modpack)
+        
+        # Refresh the config and resource pack lists when their directories change
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self.on_directory_changed)
+        
+        # Rendered mod details by id() of the mod view, and the mod currently shown
+        self._details_cache = {}
+        self._shown_mod = None
+        
+        # Loaded on first use; written shortly after it changes
+        self._scan_cache = None
+        self._scan_save_timer = QTimer(self)
+        self._scan_save_timer.setSingleShot(True)
+        self._scan_save_timer.setInterval(2000)
+        self._scan_save_timer.timeout.connect(self.save_scan_cache)
         
         self.init_ui()
         
@@ -46,6 +292,19 @@ class ModpackManagerWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
+        # Styles switched by dynamic property, so the sheet is parsed once
+        self.setStyleSheet("""
+            QLabel#compatibility {
+                font-weight: bold;
+            }
+            QLabel#compatibility[state="compatible"] {
+                color: #27ae60;
+            }
+            QLabel#compatibility[state="incompatible"] {
+                color: #e74c3c;
+            }
+        """)
+        
         # Info area
         self.info_frame = QFrame()
         info_layout = QVBoxLayout(self.info_frame)
@@ -59,8 +318,10 @@ class ModpackManagerWidget(QWidget):
         self.author_label.setStyleSheet("font-size: 12px; color: #666;")
         info_layout.addWidget(self.author_label)
         
-        self.description_text = QTextEdit()
-        self.description_text.setReadOnly(True)
+        self.description_text = QLabel("")
+        self.description_text.setWordWrap(True)
+        self.description_text.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.description_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.description_text.setMaximumHeight(100)
         info_layout.addWidget(self.description_text)
         
@@ -71,7 +332,7 @@ class ModpackManagerWidget(QWidget):
         compatibility_layout.addWidget(self.version_label)
         
         self.compatibility_label = QLabel("")
-        self.compatibility_label.setStyleSheet("font-weight: bold;")
+        self.compatibility_label.setObjectName("compatibility")
         compatibility_layout.addWidget(self.compatibility_label)
         
         compatibility_layout.addStretch()
@@ -91,9 +352,14 @@ class ModpackManagerWidget(QWidget):
         mods_layout = QVBoxLayout(self.mods_tab)
         
         # Mod list
-        self.mod_list = QListWidget()
+        self.mod_model = ModListModel(self)
+        self.mod_list = QListView()
         self.mod_list.setIconSize(QSize(32, 32))
-        self.mod_list.itemClicked.connect(self.on_mod_selected)
+        self.mod_list.setUniformItemSizes(True)
+        self.mod_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.mod_list.setBatchSize(self.LIST_BATCH_SIZE)
+        self.mod_list.setModel(self.mod_model)
+        self.mod_list.selectionModel().currentChanged.connect(self.on_mod_selected)
         mods_layout.addWidget(self.mod_list)
         
         # Mod actions
@@ -122,12 +388,71 @@ class ModpackManagerWidget(QWidget):
         self.mod_details.setMinimumHeight(100)
         mods_layout.addWidget(self.mod_details)
         
-        # Config tab
+        # Models for the lazily built tabs, so they can be filled before being shown
+        self.config_model = FileListModel(self)
+        self.resource_model = FileListModel(self)
+        
+        # Config, resource pack and settings tabs are filled in on first view
         self.config_tab = QWidget()
+        self.resource_tab = QWidget()
+        self.settings_tab = QWidget()
+        
+        # Add tabs
+        self.tab_widget.addTab(self.mods_tab, "Mods")
+        self.tab_widget.addTab(self.config_tab, "Config")
+        self.tab_widget.addTab(self.resource_tab, "Resource Packs")
+        self.tab_widget.addTab(self.settings_tab, "Settings")
+        
+        self._tab_builders = {
+            self.tab_widget.indexOf(self.config_tab): self.build_config_tab,
+            self.tab_widget.indexOf(self.resource_tab): self.build_resource_tab,
+            self.tab_widget.indexOf(self.settings_tab): self.build_settings_tab
+        }
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
+        
+        layout.addWidget(self.tab_widget)
+        
+        # Modpack actions
+        actions_layout = QHBoxLayout()
+        
+        self.update_btn = QPushButton("Check for Updates")
+        self.update_btn.clicked.connect(self.check_for_updates)
+        actions_layout.addWidget(self.update_btn)
+        
+        self.export_btn = QPushButton("Export Modpack")
+        self.export_btn.clicked.connect(self.export_modpack)
+        actions_layout.addWidget(self.export_btn)
+        
+        self.uninstall_btn = QPushButton("Uninstall")
+        self.uninstall_btn.clicked.connect(self.uninstall_modpack)
+        self.uninstall_btn.setStyleSheet("color: #e74c3c;")
+        actions_layout.addWidget(self.uninstall_btn)
+        
+        layout.addLayout(actions_layout)
+        
+        # Disable all by default
+        self.set_ui_enabled(False)
+        
+    def ensure_tab(self, index):
+        """Build a tab's contents the first time it is shown.
+        
+        Args:
+            index (int): Tab index.
+        """
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder()
+            
+    def build_config_tab(self):
+        """Build the config tab contents."""
         config_layout = QVBoxLayout(self.config_tab)
         
         # Config list
-        self.config_list = QListWidget()
+        self.config_list = QListView()
+        self.config_list.setUniformItemSizes(True)
+        self.config_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.config_list.setBatchSize(self.LIST_BATCH_SIZE)
+        self.config_list.setModel(self.config_model)
         config_layout.addWidget(self.config_list)
         
         # Config actions
@@ -141,12 +466,16 @@ class ModpackManagerWidget(QWidget):
         
         config_layout.addLayout(config_actions_layout)
         
-        # Resource packs tab
-        self.resource_tab = QWidget()
+    def build_resource_tab(self):
+        """Build the resource packs tab contents."""
         resource_layout = QVBoxLayout(self.resource_tab)
         
         # Resource pack list
-        self.resource_list = QListWidget()
+        self.resource_list = QListView()
+        self.resource_list.setUniformItemSizes(True)
+        self.resource_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.resource_list.setBatchSize(self.LIST_BATCH_SIZE)
+        self.resource_list.setModel(self.resource_model)
         resource_layout.addWidget(self.resource_list)
         
         # Resource pack actions
@@ -160,8 +489,8 @@ class ModpackManagerWidget(QWidget):
         
         resource_layout.addLayout(resource_actions_layout)
         
-        # Settings tab
-        self.settings_tab = QWidget()
+    def build_settings_tab(self):
+        """Build the settings tab contents."""
         settings_layout = QVBoxLayout(self.settings_tab)
         
         # Java settings group
@@ -193,35 +522,6 @@ class ModpackManagerWidget(QWidget):
         
         settings_layout.addWidget(modpack_group)
         
-        # Add tabs
-        self.tab_widget.addTab(self.mods_tab, "Mods")
-        self.tab_widget.addTab(self.config_tab, "Config")
-        self.tab_widget.addTab(self.resource_tab, "Resource Packs")
-        self.tab_widget.addTab(self.settings_tab, "Settings")
-        
-        layout.addWidget(self.tab_widget)
-        
-        # Modpack actions
-        actions_layout = QHBoxLayout()
-        
-        self.update_btn = QPushButton("Check for Updates")
-        self.update_btn.clicked.connect(self.check_for_updates)
-        actions_layout.addWidget(self.update_btn)
-        
-        self.export_btn = QPushButton("Export Modpack")
-        self.export_btn.clicked.connect(self.export_modpack)
-        actions_layout.addWidget(self.export_btn)
-        
-        self.uninstall_btn = QPushButton("Uninstall")
-        self.uninstall_btn.clicked.connect(self.uninstall_modpack)
-        self.uninstall_btn.setStyleSheet("color: #e74c3c;")
-        actions_layout.addWidget(self.uninstall_btn)
-        
-        layout.addLayout(actions_layout)
-        
-        # Disable all by default
-        self.set_ui_enabled(False)
-        
     def set_ui_enabled(self, enabled):
         """Enable or disable UI elements.
         
@@ -237,82 +537,227 @@ class ModpackManagerWidget(QWidget):
     def set_modpack(self, modpack):
         """Set current modpack.
         
+        The modpack is loaded after a short delay, so that only the last of
+        several quick selections is loaded. Clearing happens immediately.
+        
         Args:
             modpack (Modpack): Modpack to set.
         """
+        if not modpack:
+            self.clear_modpack()
+            return
+            
+        self._pending_modpack = modpack
+        self._select_timer.start()
+        
+    def apply_pending_modpack(self):
+        """Load the most recently selected modpack."""
+        modpack = self._pending_modpack
+        self._pending_modpack = None
         self.modpack = modpack
         
-        if modpack:
-            self.title_label.setText(modpack.name)
-            self.author_label.setText(f"by {modpack.author}")
-            self.description_text.setText(modpack.description)
-            self.version_label.setText(f"Minecraft versions: {', '.join(modpack.mc_versions)}")
+        # Apply all changes in a single repaint
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            if modpack:
+                # Version set for compatibility checks, computed once per modpack
+                self._mc_versions = frozenset(modpack.mc_versions)
+                
+                self.title_label.setText(modpack.name)
+                self.author_label.setText(f"by {modpack.author}")
+                self.description_text.setText(modpack.description)
+                self.version_label.setText(f"Minecraft versions: {', '.join(modpack.mc_versions)}")
+                
+                # Check compatibility with current Minecraft version
+                self.refresh_compatibility()
+                    
+                # Update mod count
+                self.mod_count_label.setText(f"Mods: {len(modpack.mods)}")
+                
+                # Load mods
+                self.load_mods()
+                
+                # Load configs
+                self.load_configs()
+                
+                # Load resource packs
+                self.load_resource_packs()
+                
+                # Watch for changes to configs and resource packs
+                self.watch_modpack_directories()
+                
+                # Enable UI
+                self.set_ui_enabled(True)
+            else:
+                self.clear_modpack()
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
             
-            # Check compatibility with current Minecraft version
-            current_mc_version = self.config.get("minecraft_version", "1.19.4")
-            compatible = current_mc_version in modpack.mc_versions
+    def clear_modpack(self):
+        """Clear current modpack."""
+        # Apply all changes in a single repaint
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._select_timer.stop()
+            self._pending_modpack = None
+            self.modpack = None
+            self.title_label.setText("Select a modpack")
+            self.author_label.setText("")
+            self.description_text.setText("")
+            self.version_label.setText("Minecraft versions: ")
+            self.compatibility_label.setText("")
+            self.set_compatibility_state("")
+            self.mod_count_label.setText("Mods: 0")
             
-            if compatible:
-                self.compatibility_label.setText("Compatible")
-                self.compatibility_label.setStyleSheet("color: #27ae60; font-weight: bold;")
-            else:
-                self.compatibility_label.setText("Incompatible")
-                self.compatibility_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-                
-            # Update mod count
-            self.mod_count_label.setText(f"Mods: {len(modpack.mods)}")
+            # Clear lists
+            self.cancel_config_scan()
+            self.watch_modpack_directories()
+            self.mod_model.set_mods([])
+            self.config_model.set_files([])
+            self.resource_model.set_files([])
+            
+            # Disable UI
+            self.set_ui_enabled(False)
+            self.remove_mod_btn.setEnabled(False)
+            self.update_mod_btn.setEnabled(False)
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
+        
+    def load_mods(self):
+        """Load mods from current modpack."""
+        self._details_cache.clear()
+        self._shown_mod = None
+        
+        # In a real implementation, load actual mod icons (Qt.ItemDataRole.DecorationRole)
+        self.mod_model.set_mods(self.modpack.mods if self.modpack else [])
             
-            # Load mods
-            self.load_mods()
+    def get_cached_scan(self, kind, directory):
+        """Get a cached directory listing for the current modpack.
+        
+        Args:
+            kind (str): Listing kind ("configs" or "resourcepacks").
+            directory (str): Directory the listing was taken from.
             
-            # Load configs
-            self.load_configs()
+        Returns:
+            list: (name, path) tuples, or None if the cache is missing or stale.
+        """
+        if self._scan_cache is None:
+            self._scan_cache = {}
+            if os.path.exists(self.SCAN_CACHE_FILE):
+                try:
+                    with open(self.SCAN_CACHE_FILE, "r") as f:
+                        self._scan_cache = json.load(f)
+                except Exception as e:
+                    logging.warning(f"Failed to load modpack scan cache: {e}")
+                    
+        entry = self._scan_cache.get(f"{self.modpack.id}/{kind}")
+        if not entry or entry["path"] != directory or not entry.get("mtimes"):
+            return None
             
-            # Load resource packs
-            self.load_resource_packs()
+        # Files added, removed or renamed in any listed directory change that directory's mtime
+        try:
+            for path, mtime in entry["mtimes"].items():
+                if os.path.getmtime(path) != mtime:
+                    return None
+        except OSError:
+            return None
             
-            # Enable UI
-            self.set_ui_enabled(True)
-        else:
-            self.clear_modpack()
+        return [tuple(file) for file in entry["files"]]
+        
+    def store_scan(self, modpack_id, kind, directory, mtimes, files):
+        """Cache a directory listing and schedule writing the cache to disk.
+        
+        Args:
+            modpack_id (str): Modpack ID.
+            kind (str): Listing kind ("configs" or "resourcepacks").
+            directory (str): Directory the listing was taken from.
+            mtimes (dict): Modification time of every directory listed, taken before listing.
+            files (list): (name, path) tuples.
+        """
+        if self._scan_cache is None or not mtimes:
+            return
             
-    def clear_modpack(self):
-        """Clear current modpack."""
-        self.modpack = None
-        self.title_label.setText("Select a modpack")
-        self.author_label.setText("")
-        self.description_text.setText("")
-        self.version_label.setText("Minecraft versions: ")
-        self.compatibility_label.setText("")
-        self.mod_count_label.setText("Mods: 0")
-        
-        # Clear lists
-        self.mod_list.clear()
-        self.config_list.clear()
-        self.resource_list.clear()
-        
-        # Disable UI
-        self.set_ui_enabled(False)
-        self.remove_mod_btn.setEnabled(False)
-        self.update_mod_btn.setEnabled(False)
+        self._scan_cache[f"{modpack_id}/{kind}"] = {
+            "path": directory,
+            "mtimes": mtimes,
+            "files": files
+        }
+        self._scan_save_timer.start()
+        
+    def save_scan_cache(self):
+        """Write the directory listing cache to disk."""
+        if not self._scan_cache:
+            return
+            
+        try:
+            os.makedirs(os.path.dirname(self.SCAN_CACHE_FILE), exist_ok=True)
+            with open(self.SCAN_CACHE_FILE, "w") as f:
+                json.dump(self._scan_cache, f)
+        except Exception as e:
+            logging.warning(f"Failed to save modpack scan cache: {e}")
+            
+    def cancel_config_scan(self):
+        """Stop any running config scan and ignore its results."""
+        self._config_dir = None
         
-    def load_mods(self):
-        """Load mods from current modpack."""
-        self.mod_list.clear()
+        if self._config_thread is not None:
+            self._config_thread.requestInterruption()
+            self._config_thread = None
+            
+    def config_scan_finished(self, scan_thread):
+        """Forget a config scan thread that has finished.
         
-        if not self.modpack:
+        Args:
+            scan_thread (ConfigScanThread): Finished thread.
+        """
+        if self._config_thread is scan_thread:
+            self._config_thread = None
+            
+    def watch_modpack_directories(self):
+        """Watch the current modpack's config and resource pack directories."""
+        watched = self._fs_watcher.directories()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+            
+        if not self.modpack or not self.modpack.is_installed:
             return
             
-        for mod_info in self.modpack.mods:
-            item = QListWidgetItem(mod_info.get("name", "Unknown Mod"))
-            # In a real implementation, load actual mod icons
-            # item.setIcon(QIcon(mod_icon_path))
-            item.setData(Qt.ItemDataRole.UserRole, mod_info)
-            self.mod_list.addItem(item)
+        directories = [
+            os.path.join(self.modpack.install_path, "config"),
+            os.path.join(self.modpack.install_path, "resourcepacks")
+        ]
+        directories = [directory for directory in directories if os.path.isdir(directory)]
+        if directories:
+            self._fs_watcher.addPaths(directories)
             
-    def load_configs(self):
-        """Load configs from current modpack."""
-        self.config_list.clear()
+    def on_directory_changed(self, path):
+        """Refresh the list backed by a changed directory.
+        
+        Args:
+            path (str): Changed directory.
+        """
+        if not self.modpack or not self.modpack.is_installed:
+            return
+            
+        if path == os.path.join(self.modpack.install_path, "config"):
+            self.load_configs(refresh=True)
+        elif path == os.path.join(self.modpack.install_path, "resourcepacks"):
+            self.load_resource_packs()
+            
+    def load_configs(self, refresh=False):
+        """Load configs from current modpack in the background.
+        
+        Args:
+            refresh (bool): Keep the current rows and only apply changes,
+                instead of clearing the list while scanning.
+        """
+        if not refresh:
+            self.config_model.set_files([])
+        self.cancel_config_scan()
         
         if not self.modpack or not self.modpack.is_installed:
             return
@@ -321,56 +766,105 @@ class ModpackManagerWidget(QWidget):
         if not os.path.exists(config_dir):
             return
             
-        for root, dirs, files in os.walk(config_dir):
-            for file in files:
-                rel_path = os.path.relpath(os.path.join(root, file), config_dir)
-                item = QListWidgetItem(rel_path)
-                item.setData(Qt.ItemDataRole.UserRole, os.path.join(root, file))
-                self.config_list.addItem(item)
+        # Reuse the previous listing while no directory in it has changed
+        files = self.get_cached_scan("configs", config_dir)
+        if files is not None:
+            self.config_model.update_files(files)
+            return
+            
+        self._config_dir = config_dir
+        
+        scan_thread = ConfigScanThread(config_dir, self)
+        scan_thread.scanned.connect(self.configs_scanned)
+        scan_thread.finished.connect(lambda: self.config_scan_finished(scan_thread))
+        scan_thread.finished.connect(scan_thread.deleteLater)
+        self._config_thread = scan_thread
+        scan_thread.start()
+        
+    @pyqtSlot(str, list, dict)
+    def configs_scanned(self, config_dir, files, mtimes):
+        """Handle config scan completion.
+        
+        Args:
+            config_dir (str): Scanned config directory.
+            files (list): (relative path, path) tuples.
+            mtimes (dict): Modification time of every directory walked,
+                empty if the walk was incomplete.
+        """
+        # Ignore results for a modpack that is no longer shown
+        if config_dir != self._config_dir:
+            return
+            
+        self.store_scan(self.modpack.id, "configs", config_dir, mtimes, files)
+        self.config_model.update_files(files)
                 
     def load_resource_packs(self):
         """Load resource packs from current modpack."""
-        self.resource_list.clear()
+        files = []
         
-        if not self.modpack or not self.modpack.is_installed:
-            return
-            
-        resource_dir = os.path.join(self.modpack.install_path, "resourcepacks")
-        if not os.path.exists(resource_dir):
-            return
+        if self.modpack and self.modpack.is_installed:
+            resource_dir = os.path.join(self.modpack.install_path, "resourcepacks")
             
-        for file in os.listdir(resource_dir):
-            item = QListWidgetItem(file)
-            item.setData(Qt.ItemDataRole.UserRole, os.path.join(resource_dir, file))
-            self.resource_list.addItem(item)
+            if os.path.exists(resource_dir):
+                # Reuse the previous listing while the directory is unchanged
+                files = self.get_cached_scan("resourcepacks", resource_dir)
+                
+                if files is None:
+                    mtimes = {resource_dir: os.path.getmtime(resource_dir)}
+                    
+                    # Single pass skipping hidden files and partial downloads
+                    with os.scandir(resource_dir) as entries:
+                        files = sorted(
+                            (entry.name, entry.path) for entry in entries
+                            if entry.is_file(follow_symlinks=False)
+                            and not entry.name.startswith(".")
+                            and entry.name.endswith(self.RESOURCE_PACK_EXTENSIONS)
+                        )
+                        
+                    self.store_scan(self.modpack.id, "resourcepacks", resource_dir, mtimes, files)
+                    
+        self.resource_model.update_files(files)
             
-    def on_mod_selected(self, item):
+    def on_mod_selected(self, current, previous=None):
         """Handle mod selection.
         
         Args:
-            item (QListWidgetItem): Selected item.
+            current (QModelIndex): Selected index.
+            previous (QModelIndex): Previously selected index.
         """
-        if not item:
+        if not current.isValid():
+            self._shown_mod = None
             self.mod_details.setText("Select a mod to view details")
             self.remove_mod_btn.setEnabled(False)
             self.update_mod_btn.setEnabled(False)
             return
             
-        mod_info = item.data(Qt.ItemDataRole.UserRole)
+        mod_info = current.data(Qt.ItemDataRole.UserRole)
         
-        # Build details text
-        details = f"<b>{mod_info.get('name', 'Unknown Mod')}</b> v{mod_info.get('version', 'Unknown')}<br>"
-        
-        if mod_info.get('description'):
-            details += f"{mod_info.get('description')}<br>"
+        # Nothing to do when the mod shown is reselected
+        if mod_info is self._shown_mod:
+            return
             
-        details += f"<br>Minecraft versions: {', '.join(mod_info.get('mc_versions', []))}"
+        self._shown_mod = mod_info
         
-        if mod_info.get('dependencies'):
-            details += f"<br><br>Dependencies:<br>"
-            for dep in mod_info.get('dependencies', []):
-                details += f"• {dep}<br>"
-                
+        # Build details text once per mod
+        cached = self._details_cache.get(id(mod_info))
+        if cached and cached[0] is mod_info:
+            details = cached[1]
+        else:
+            description = f"{mod_info.description}<br>" if mod_info.description else ""
+            dependencies = (
+                "<br><br>Dependencies:<br>" + "".join(f"• {dep}<br>" for dep in mod_info.dependencies)
+                if mod_info.dependencies else ""
+            )
+            details = (
+                f"<b>{mod_info.name}</b> v{mod_info.version}<br>"
+                f"{description}"
+                f"<br>Minecraft versions: {', '.join(mod_info.mc_versions)}"
+                f"{dependencies}"
+            )
+            self._details_cache[id(mod_info)] = (mod_info, details)
+            
         self.mod_details.setText(details)
         self.remove_mod_btn.setEnabled(True)
         self.update_mod_btn.setEnabled(True)
@@ -393,26 +887,27 @@ class ModpackManagerWidget(QWidget):
         if not self.modpack:
             return
             
-        current_item = self.mod_list.currentItem()
-        if not current_item:
+        current_index = self.mod_list.currentIndex()
+        if not current_index.isValid():
             return
             
-        mod_info = current_item.data(Qt.ItemDataRole.UserRole)
+        mod_info = current_index.data(Qt.ItemDataRole.UserRole)
         
         # Confirm removal
         result = QMessageBox.question(
             self,
             "Remove Mod",
-            f"Are you sure you want to remove {mod_info.get('name', 'this mod')}?",
+            f"Are you sure you want to remove {mod_info.name}?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if result == QMessageBox.StandardButton.Yes:
             # Remove mod
-            if self.modpack_manager.remove_mod_from_modpack(self.modpack, mod_info.get('id')):
+            if self.modpack_manager.remove_mod_from_modpack(self.modpack, mod_info.id):
                 # Update UI
                 self.load_mods()
                 self.mod_count_label.setText(f"Mods: {len(self.modpack.mods)}")
+                self._shown_mod = None
                 self.mod_details.setText("Select a mod to view details")
                 self.remove_mod_btn.setEnabled(False)
                 self.update_mod_btn.setEnabled(False)
@@ -423,7 +918,7 @@ class ModpackManagerWidget(QWidget):
                 QMessageBox.warning(
                     self,
                     "Error",
-                    f"Failed to remove {mod_info.get('name', 'mod')}."
+                    f"Failed to remove {mod_info.name}."
                 )
                 
     def update_mod(self):
@@ -431,18 +926,18 @@ class ModpackManagerWidget(QWidget):
         if not self.modpack:
             return
             
-        current_item = self.mod_list.currentItem()
-        if not current_item:
+        current_index = self.mod_list.currentIndex()
+        if not current_index.isValid():
             return
             
-        mod_info = current_item.data(Qt.ItemDataRole.UserRole)
+        mod_info = current_index.data(Qt.ItemDataRole.UserRole)
         
         # In a real implementation, this would check for updates for the mod
         # and install them if available
         QMessageBox.information(
             self,
             "Update Mod",
-            f"Checking for updates for {mod_info.get('name', 'this mod')}..."
+            f"Checking for updates for {mod_info.name}..."
         )
         
     def check_for_updates(self):
@@ -474,20 +969,59 @@ class ModpackManagerWidget(QWidget):
         if not export_path:
             return
             
-        # Export modpack
-        if self.modpack_manager.export_modpack(self.modpack, export_path):
+        # Export modpack in the background
+        modpack = self.modpack
+        self.run_modpack_task(
+            f"Exporting {modpack.name}...",
+            lambda success: self.export_finished(modpack, export_path, success),
+            self.modpack_manager.export_modpack, modpack, export_path
+        )
+        
+    def export_finished(self, modpack, export_path, success):
+        """Handle export completion.
+        
+        Args:
+            modpack (Modpack): Exported modpack.
+            export_path (str): Path of the exported ZIP file.
+            success (bool): Whether the export succeeded.
+        """
+        if success:
             QMessageBox.information(
                 self,
                 "Export Successful",
-                f"Modpack {self.modpack.name} exported to {export_path}."
+                f"Modpack {modpack.name} exported to {export_path}."
             )
         else:
             QMessageBox.warning(
                 self,
                 "Export Failed",
-                f"Failed to export modpack {self.modpack.name}."
+                f"Failed to export modpack {modpack.name}."
             )
             
+    def run_modpack_task(self, label, callback, task, *args):
+        """Run a modpack operation in a background thread behind a busy dialog.
+        
+        Args:
+            label (str): Text shown in the progress dialog.
+            callback: Called with the task's success once it finishes.
+            task: ModpackManager method to run.
+            *args: Arguments for the task.
+        """
+        progress = QProgressDialog(label, None, 0, 0, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+        
+        def task_completed(success):
+            progress.close()
+            progress.deleteLater()
+            callback(success)
+            
+        task_thread = ModpackTaskThread(task, *args, parent=self)
+        task_thread.completed.connect(task_completed)
+        task_thread.finished.connect(task_thread.deleteLater)
+        task_thread.start()
+        
     def uninstall_modpack(self):
         """Uninstall modpack."""
         if not self.modpack:
@@ -502,25 +1036,40 @@ class ModpackManagerWidget(QWidget):
         )
         
         if result == QMessageBox.StandardButton.Yes:
-            # Uninstall modpack
-            if self.modpack_manager.uninstall_modpack(self.modpack):
-                # Clear UI
+            # Uninstall modpack in the background
+            modpack = self.modpack
+            self.run_modpack_task(
+                f"Uninstalling {modpack.name}...",
+                lambda success: self.uninstall_finished(modpack, success),
+                self.modpack_manager.uninstall_modpack, modpack
+            )
+            
+    def uninstall_finished(self, modpack, success):
+        """Handle uninstall completion.
+        
+        Args:
+            modpack (Modpack): Uninstalled modpack.
+            success (bool): Whether the uninstall succeeded.
+        """
+        if success:
+            # Clear UI
+            if self.modpack is modpack:
                 self.clear_modpack()
                 
-                # Emit signal
-                self.modpack_updated.emit(None)
-                
-                QMessageBox.information(
-                    self,
-                    "Uninstall Successful",
-                    f"Modpack {self.modpack.name} uninstalled."
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Uninstall Failed",
-                    f"Failed to uninstall modpack {self.modpack.name}."
-                )
+            # Emit signal
+            self.modpack_updated.emit(None)
+            
+            QMessageBox.information(
+                self,
+                "Uninstall Successful",
+                f"Modpack {modpack.name} uninstalled."
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Uninstall Failed",
+                f"Failed to uninstall modpack {modpack.name}."
+            )
                 
     def refresh_compatibility(self):
         """Refresh compatibility status."""
@@ -529,11 +1078,25 @@ class ModpackManagerWidget(QWidget):
             
         # Check compatibility with current Minecraft version
         current_mc_version = self.config.get("minecraft_version", "1.19.4")
-        compatible = current_mc_version in self.modpack.mc_versions
+        compatible = current_mc_version in self._mc_versions
         
         if compatible:
             self.compatibility_label.setText("Compatible")
-            self.compatibility_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            self.set_compatibility_state("compatible")
         else:
             self.compatibility_label.setText("Incompatible")
-            self.compatibility_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
\ No newline at end of file
+            self.set_compatibility_state("incompatible")
+            
+    def set_compatibility_state(self, state):
+        """Restyle the compatibility label for a state.
+        
+        Args:
+            state (str): "compatible", "incompatible" or "" for none.
+        """
+        if self.compatibility_label.property("state") == state:
+            return
+            
+        self.compatibility_label.setProperty("state", state)
+        style = self.compatibility_label.style()
+        style.unpolish(self.compatibility_label)
+        style.polish(self.compatibility_label)
\ No newline at end of file
@@ -7,33 +7,64 @@ Settings dialog for the Minecraft Modpack Launcher.
 
 import os
 import logging
+import hashlib
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Streaming JSON parser for counting modpacks without loading the whole list
+try:
+    import ijson
+except ImportError:
+    ijson = None
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QPushButton, QTabWidget, QWidget,
-    QFormLayout, QMessageBox, QCheckBox
+    QFormLayout, QMessageBox, QCheckBox, QFileDialog, QStyle
 )
-from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtCore import Qt, QSettings, QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Platform-specific Java lookup defaults
+_IS_WINDOWS = os.name == "nt"
+_JAVA_DEFAULT_DIR = "C:\\Program Files\\Java" if _IS_WINDOWS else "/usr/bin"
+_JAVA_FILTER = "Java Executable (java.exe)" if _IS_WINDOWS else "Java Executable (java)"
+_WHICH_JAVA_ARGV = ["where", "java"] if _IS_WINDOWS else ["which", "java"]
+
+# Shared HTTP session so repeated connection tests reuse pooled connections
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def _get_http_session():
+    """Get the shared HTTP session, creating it on first use.
+    
+    Returns:
+        requests.Session: Session with a small connection pool.
+    """
+    global _http_session
+    
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip"})
+            _http_session = session
+            
+    return _http_session
 
 class ModernLineEdit(QLineEdit):
     """Modern styled line edit with rounded corners."""
     
     def __init__(self, placeholder="", parent=None):
         super().__init__(parent)
+        self.setObjectName("modernEdit")
         self.setFixedHeight(40)
         self.setPlaceholderText(placeholder)
-        self.setStyleSheet("""
-            QLineEdit {
-                background-color: #2B3142;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                background-color: #323848;
-            }
-        """)
 
 class ModernButton(QPushButton):
     """Modern styled button with rounded corners and hover effects."""
@@ -41,53 +72,72 @@ class ModernButton(QPushButton):
     def __init__(self, text, accent=False, parent=None):
         super().__init__(text, parent)
         self.accent = accent
+        self.setObjectName("modernBtn")
+        self.setProperty("accent", accent)
         self.setFixedHeight(40)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+class RepositoryTestSignals(QObject):
+    """Signals emitted by RepositoryTestTask."""
+    
+    completed = pyqtSignal(object)
+
+class RepositoryTestTask(QRunnable):
+    """Thread pool task for testing a repository API endpoint."""
+    
+    def __init__(self, api_url):
+        """Initialize repository test task.
         
-        # Set style based on button type
-        if accent:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #E61B72;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 10px 20px;
-                    font-size: 14px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #F32A81;
-                }
-                QPushButton:pressed {
-                    background-color: #D10A61;
-                }
-                QPushButton:disabled {
-                    background-color: #444B5A;
-                    color: #8D93A0;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #2B3142;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 10px 20px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #363D51;
-                }
-                QPushButton:pressed {
-                    background-color: #222736;
-                }
-                QPushButton:disabled {
-                    background-color: #232734;
-                    color: #6D727E;
-                }
-            """)
+        Args:
+            api_url (str): Repository modpacks API URL.
+        """
+        super().__init__()
+        self.api_url = api_url
+        self.signals = RepositoryTestSignals()
+        
+    def run(self):
+        """Request the endpoint and emit a (status, payload) result."""
+        try:
+            # Separate connect and read timeouts so a dead host fails fast
+            with _get_http_session().get(self.api_url, stream=True, timeout=(2, 5)) as response:
+                # Check response
+                if response.status_code == 200:
+                    try:
+                        result = ("ok", self._count_modpacks(response))
+                    except Exception:
+                        result = ("unparsed", None)
+                else:
+                    result = ("status", response.status_code)
+                
+        except requests.exceptions.ConnectTimeout as e:
+            result = ("timeout", e)
+            
+        except requests.exceptions.ConnectionError as e:
+            result = ("connection", e)
+            
+        except Exception as e:
+            result = ("error", e)
+            
+        self.signals.completed.emit(result)
+        
+    @staticmethod
+    def _count_modpacks(response):
+        """Count the modpacks in a repository response.
+        
+        Args:
+            response (requests.Response): Streamed API response.
+            
+        Returns:
+            int: Number of modpacks listed.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        
+        if ijson is not None and "json" in content_type:
+            # Count array items as they stream in
+            response.raw.decode_content = True
+            return sum(1 for _ in ijson.items(response.raw, "item"))
+            
+        return len(response.json())
 
 class SettingsDialog(QDialog):
     """Settings dialog for the Minecraft Modpack Launcher."""
@@ -101,55 +151,16 @@ class SettingsDialog(QDialog):
         """
         super().__init__(parent)
         self.config = config
+        self._repo_test_task = None
         self.init_ui()
         self.load_settings()
         
     def init_ui(self):
         """Initialize user interface."""
+        # Styled by the application stylesheet in app.ui.theme
+        self.setObjectName("SettingsDialog")
         self.setWindowTitle("Project Launcher Settings")
         self.setMinimumWidth(500)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1A1C23;
-                color: white;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QTabWidget::pane {
-                border: none;
-                background-color: #1A1C23;
-            }
-            QTabBar::tab {
-                background-color: #2B3142;
-                color: white;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                min-width: 100px;
-                padding: 8px 16px;
-                margin-right: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #E61B72;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #363D51;
-            }
-            QLabel {
-                color: white;
-            }
-            QCheckBox {
-                color: white;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 3px;
-                background-color: #2B3142;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #E61B72;
-                image: url('app/ui/resources/checkmark.png');
-            }
-        """)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -187,13 +198,13 @@ class SettingsDialog(QDialog):
         self.minecraft_dir_edit = ModernLineEdit()
         minecraft_form.addRow("Minecraft Directory:", self.minecraft_dir_edit)
         
-        mc_dir_layout = QHBoxLayout()
-        self.browse_mc_dir_btn = ModernButton("Browse...")
-        self.browse_mc_dir_btn.clicked.connect(self.browse_minecraft_dir)
-        mc_dir_layout.addWidget(self.browse_mc_dir_btn)
-        mc_dir_layout.addStretch()
-        
-        minecraft_form.addRow("", mc_dir_layout)
+        # Browse as a trailing action inside the field
+        browse_mc_dir_action = self.minecraft_dir_edit.addAction(
+            self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon),
+            QLineEdit.ActionPosition.TrailingPosition
+        )
+        browse_mc_dir_action.setToolTip("Browse...")
+        browse_mc_dir_action.triggered.connect(self.browse_minecraft_dir)
         general_layout.addLayout(minecraft_form)
         
         # Update settings
@@ -202,8 +213,43 @@ class SettingsDialog(QDialog):
         
         general_layout.addStretch(1)
         
-        # Java settings tab
+        # Java settings tab, built when first shown
         self.java_tab = QWidget()
+        
+        # Add tabs
+        self.tab_widget.addTab(self.general_tab, "General")
+        java_index = self.tab_widget.addTab(self.java_tab, "Java")
+        
+        self._tab_builders = {java_index: self.build_java_tab}
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
+        
+        layout.addWidget(self.tab_widget)
+        
+        # Bottom buttons
+        buttons_layout = QHBoxLayout()
+        
+        self.cancel_btn = ModernButton("Cancel")
+        self.cancel_btn.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.cancel_btn)
+        
+        self.save_btn = ModernButton("Save", True)
+        self.save_btn.clicked.connect(self.accept)
+        buttons_layout.addWidget(self.save_btn)
+        
+        layout.addLayout(buttons_layout)
+        
+    def ensure_tab(self, index):
+        """Build a tab's contents the first time it is shown.
+        
+        Args:
+            index (int): Tab index.
+        """
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder()
+            
+    def build_java_tab(self):
+        """Build the Java tab contents and load its settings."""
         java_layout = QVBoxLayout(self.java_tab)
         java_layout.setContentsMargins(20, 20, 20, 20)
         java_layout.setSpacing(15)
@@ -215,18 +261,20 @@ class SettingsDialog(QDialog):
         self.java_path_edit = ModernLineEdit()
         java_form.addRow("Java Path:", self.java_path_edit)
         
-        java_path_layout = QHBoxLayout()
-        self.browse_java_btn = ModernButton("Browse...")
-        self.browse_java_btn.clicked.connect(self.browse_java_path)
-        java_path_layout.addWidget(self.browse_java_btn)
-        
-        self.detect_java_btn = ModernButton("Auto-detect")
-        self.detect_java_btn.clicked.connect(self.detect_java)
-        java_path_layout.addWidget(self.detect_java_btn)
-        
-        java_path_layout.addStretch()
+        # Auto-detect and browse as trailing actions inside the field
+        detect_java_action = self.java_path_edit.addAction(
+            self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload),
+            QLineEdit.ActionPosition.TrailingPosition
+        )
+        detect_java_action.setToolTip("Auto-detect")
+        detect_java_action.triggered.connect(self.detect_java)
         
-        java_form.addRow("", java_path_layout)
+        browse_java_action = self.java_path_edit.addAction(
+            self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon),
+            QLineEdit.ActionPosition.TrailingPosition
+        )
+        browse_java_action.setToolTip("Browse...")
+        browse_java_action.triggered.connect(self.browse_java_path)
         
         # Java memory
         self.java_memory_edit = ModernLineEdit(placeholder="2G")
@@ -239,24 +287,7 @@ class SettingsDialog(QDialog):
         java_layout.addLayout(java_form)
         java_layout.addStretch(1)
         
-        # Add tabs
-        self.tab_widget.addTab(self.general_tab, "General")
-        self.tab_widget.addTab(self.java_tab, "Java")
-        
-        layout.addWidget(self.tab_widget)
-        
-        # Bottom buttons
-        buttons_layout = QHBoxLayout()
-        
-        self.cancel_btn = ModernButton("Cancel")
-        self.cancel_btn.clicked.connect(self.reject)
-        buttons_layout.addWidget(self.cancel_btn)
-        
-        self.save_btn = ModernButton("Save", True)
-        self.save_btn.clicked.connect(self.accept)
-        buttons_layout.addWidget(self.save_btn)
-        
-        layout.addLayout(buttons_layout)
+        self.load_java_settings()
         
     def load_settings(self):
         """Load settings from config."""
@@ -272,64 +303,84 @@ class SettingsDialog(QDialog):
         check_updates = self.config.get("check_for_updates", True)
         self.check_updates_cb.setChecked(check_updates)
         
-        # Java settings
+    def load_java_settings(self):
+        """Load Java settings from config."""
         java_path = self.config.get("java_path", "java")
         self.java_path_edit.setText(java_path)
         
         # Extract memory allocation from Java args
         java_args = self.config.get("java_args", "-Xmx2G")
-        memory = "2G"
-        args = []
-        
-        for arg in java_args.split():
-            if arg.startswith("-Xmx"):
-                memory = arg[4:]  # Remove "-Xmx" prefix
-            else:
-                args.append(arg)
+        head, sep, tail = java_args.partition("-Xmx")
+        
+        if sep:
+            memory, _, rest = tail.partition(" ")
+            args = f"{head.strip()} {rest.strip()}".strip()
+        else:
+            memory, args = "2G", java_args.strip()
                 
         self.java_memory_edit.setText(memory)
-        self.java_args_edit.setText(" ".join(args))
+        self.java_args_edit.setText(args)
+        
+    def _set_if_changed(self, key, value):
+        """Set a config value only when it differs from the stored one.
+        
+        Args:
+            key (str): Configuration key.
+            value: Configuration value.
+            
+        Returns:
+            bool: True if the value was changed.
+        """
+        if self.config.get(key) == value:
+            return False
+            
+        self.config.set(key, value)
+        return True
         
     def save_settings(self):
         """Save settings to config."""
+        dirty = False
+        
         # Server URL
         server_url = self.repo_url_edit.text().strip()
         if server_url:
-            self.config.set("server_url", server_url)
+            dirty |= self._set_if_changed("server_url", server_url)
             
             # Update repository URLs
             repos = self.config.get("repositories", {})
-            for repo_id, repo_info in repos.items():
-                repo_info["url"] = server_url
-            self.config.set("repositories", repos)
+            if any(repo_info.get("url") != server_url for repo_info in repos.values()):
+                for repo_id, repo_info in repos.items():
+                    repo_info["url"] = server_url
+                self.config.set("repositories", repos)
+                dirty = True
             
         # Minecraft directory
         mc_dir = self.minecraft_dir_edit.text().strip()
         if mc_dir:
-            self.config.set("minecraft_directory", mc_dir)
+            dirty |= self._set_if_changed("minecraft_directory", mc_dir)
             
         # Check for updates
-        self.config.set("check_for_updates", self.check_updates_cb.isChecked())
+        dirty |= self._set_if_changed("check_for_updates", self.check_updates_cb.isChecked())
         
-        # Java settings
-        java_path = self.java_path_edit.text().strip()
-        if java_path:
-            self.config.set("java_path", java_path)
-            
-        # Memory and Java args
-        memory = self.java_memory_edit.text().strip()
-        if not memory.startswith("-Xmx"):
-            memory = f"-Xmx{memory}"
-            
-        args = self.java_args_edit.text().strip()
-        java_args = memory
-        if args:
-            java_args = f"{memory} {args}"
+        # Java settings, unchanged unless the Java tab was opened
+        if self.java_tab.layout() is not None:
+            java_path = self.java_path_edit.text().strip()
+            if java_path:
+                dirty |= self._set_if_changed("java_path", java_path)
+                
+            # Memory and Java args
+            memory = self.java_memory_edit.text().strip()
+            if not memory.startswith("-Xmx"):
+                memory = f"-Xmx{memory}"
+                
+            args = self.java_args_edit.text().strip()
+            java_args = f"{memory} {args}".rstrip()
             
-        self.config.set("java_args", java_args)
+            dirty |= self._set_if_changed("java_args", java_args)
         
-        # Save all changes
-        self.config.save()
+        # Save all changes, skipping the write when nothing changed
+        if dirty:
+            self.config.save()
         
     def accept(self):
         """Override accept to save settings."""
@@ -338,12 +389,9 @@ class SettingsDialog(QDialog):
         
     def browse_minecraft_dir(self):
         """Browse for Minecraft directory."""
-        from PyQt6.QtWidgets import QFileDialog
-        
         current_dir = self.minecraft_dir_edit.text()
         if not current_dir:
             # Default to home directory
-            from pathlib import Path
             current_dir = str(Path.home())
             
         directory = QFileDialog.getExistingDirectory(
@@ -357,25 +405,18 @@ class SettingsDialog(QDialog):
             
     def browse_java_path(self):
         """Browse for Java executable."""
-        from PyQt6.QtWidgets import QFileDialog
-        
         current_path = self.java_path_edit.text()
         current_dir = os.path.dirname(current_path) if current_path else ""
         
         if not current_dir:
             # Default to a common location
-            if os.name == "nt":  # Windows
-                current_dir = "C:\\Program Files\\Java"
-            else:
-                current_dir = "/usr/bin"
-                
-        file_filter = "Java Executable (java.exe)" if os.name == "nt" else "Java Executable (java)"
+            current_dir = _JAVA_DEFAULT_DIR
         
         java_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Java Executable",
             current_dir,
-            file_filter
+            _JAVA_FILTER
         )
         
         if java_path:
@@ -384,23 +425,27 @@ class SettingsDialog(QDialog):
     def detect_java(self):
         """Auto-detect Java installation."""
         try:
-            import subprocess
+            # Detection results are remembered per PATH
+            settings = QSettings()
+            path_key = hashlib.blake2b(os.environ.get("PATH", "").encode("utf-8"), digest_size=8).hexdigest()
+            cache_key = f"java_path/{path_key}"
             
-            # Try to run java -version
-            if os.name == "nt":  # Windows
-                proc = subprocess.run(["where", "java"], capture_output=True, text=True, check=False)
+            java_path = settings.value(cache_key)
+            if not java_path or not os.path.exists(java_path):
+                java_path = shutil.which("java")
+                
+            if not java_path:
+                # Fall back to asking the shell
+                proc = subprocess.run(_WHICH_JAVA_ARGV, capture_output=True, text=True, check=False)
+                    
                 if proc.returncode == 0 and proc.stdout.strip():
                     java_path = proc.stdout.splitlines()[0].strip()
-                    self.java_path_edit.setText(java_path)
-                    QMessageBox.information(self, "Java Detected", f"Found Java at: {java_path}")
-                    return
-            else:
-                proc = subprocess.run(["which", "java"], capture_output=True, text=True, check=False)
-                if proc.returncode == 0 and proc.stdout.strip():
-                    java_path = proc.stdout.strip()
-                    self.java_path_edit.setText(java_path)
-                    QMessageBox.information(self, "Java Detected", f"Found Java at: {java_path}")
-                    return
+                    
+            if java_path:
+                settings.setValue(cache_key, java_path)
+                self.java_path_edit.setText(java_path)
+                QMessageBox.information(self, "Java Detected", f"Found Java at: {java_path}")
+                return
                     
             # If we get here, no Java was found
             QMessageBox.warning(self, "Java Not Found", "Could not automatically detect Java installation.")
@@ -408,6 +453,15 @@ class SettingsDialog(QDialog):
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error detecting Java: {str(e)}")
             
+    def set_testing(self, testing):
+        """Switch the test button between its idle and testing states.
+        
+        Args:
+            testing (bool): Whether a repository test is running.
+        """
+        self.test_repo_btn.setEnabled(not testing)
+        self.test_repo_btn.setText("Testing..." if testing else "Test Connection")
+        
     def test_repository(self):
         """Test connection to the repository."""
         url = self.repo_url_edit.text().strip()
@@ -416,58 +470,50 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "Invalid URL", "Please enter a repository URL.")
             return
             
-        try:
-            import requests
+        # Make sure the URL has http:// or https:// prefix
+        if not url.startswith(("http://", "https://")):
+            url = "http://" + url
+            self.repo_url_edit.setText(url)
             
-            # Make sure the URL has http:// or https:// prefix
-            if not url.startswith(("http://", "https://")):
-                url = "http://" + url
-                self.repo_url_edit.setText(url)
-                
-            # Try to connect to the API endpoint
-            api_url = f"{url}/api/modpacks"
-            
-            self.test_repo_btn.setEnabled(False)
-            self.test_repo_btn.setText("Testing...")
-            
-            response = requests.get(api_url, timeout=5)
-            
-            self.test_repo_btn.setEnabled(True)
-            self.test_repo_btn.setText("Test Connection")
-            
-            # Check response
-            if response.status_code == 200:
-                try:
-                    modpacks = response.json()
-                    QMessageBox.information(
-                        self, 
-                        "Connection Successful", 
-                        f"Successfully connected to the repository. Found {len(modpacks)} modpacks."
-                    )
-                except Exception:
-                    QMessageBox.information(
-                        self, 
-                        "Connection Successful", 
-                        "Successfully connected to the repository, but could not parse the response."
-                    )
-            else:
-                QMessageBox.warning(
-                    self, 
-                    "Connection Failed", 
-                    f"Could not connect to the repository. Status code: {response.status_code}"
-                )
-                
-        except requests.exceptions.ConnectTimeout:
-            self.test_repo_btn.setEnabled(True)
-            self.test_repo_btn.setText("Test Connection")
+        self.set_testing(True)
+        
+        # Try to connect to the API endpoint off the GUI thread
+        self._repo_test_task = RepositoryTestTask(f"{url}/api/modpacks")
+        self._repo_test_task.signals.completed.connect(self.on_repository_tested)
+        QThreadPool.globalInstance().start(self._repo_test_task)
+        
+    def on_repository_tested(self, result):
+        """Handle repository test result.
+        
+        Args:
+            result (tuple): Result status and its payload from RepositoryTestTask.
+        """
+        self._repo_test_task = None
+        self.set_testing(False)
+        
+        status, payload = result
+        
+        if status == "ok":
+            QMessageBox.information(
+                self, 
+                "Connection Successful", 
+                f"Successfully connected to the repository. Found {payload} modpacks."
+            )
+        elif status == "unparsed":
+            QMessageBox.information(
+                self, 
+                "Connection Successful", 
+                "Successfully connected to the repository, but could not parse the response."
+            )
+        elif status == "status":
+            QMessageBox.warning(
+                self, 
+                "Connection Failed", 
+                f"Could not connect to the repository. Status code: {payload}"
+            )
+        elif status == "timeout":
             QMessageBox.warning(self, "Connection Timeout", "Connection to the repository timed out.")
-            
-        except requests.exceptions.ConnectionError:
-            self.test_repo_btn.setEnabled(True)
-            self.test_repo_btn.setText("Test Connection")
+        elif status == "connection":
             QMessageBox.warning(self, "Connection Error", "Could not connect to the repository.")
-            
-        except Exception as e:
-            self.test_repo_btn.setEnabled(True)
-            self.test_repo_btn.setText("Test Connection")
-            QMessageBox.warning(self, "Error", f"Error testing repository: {str(e)}")
\ No newline at end of file
+        else:
+            QMessageBox.warning(self, "Error", f"Error testing repository: {str(payload)}")
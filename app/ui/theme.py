@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Application-wide stylesheet for the Minecraft Modpack Launcher.
+"""
+
+import os
+
+# Checkbox tick image, resolved once against this module rather than the working directory
+_CHECKMARK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "checkmark.png")
+_CHECKMARK_QSS = (
+    f"#SettingsDialog QCheckBox::indicator:checked {{ image: url('{_CHECKMARK_PATH.replace(os.sep, '/')}'); }}"
+    if os.path.exists(_CHECKMARK_PATH) else ""
+)
+
+# Settings dialog, scoped by object name so other windows are unaffected
+_SETTINGS_DIALOG_QSS = """
+    QDialog#SettingsDialog {
+        background-color: #1A1C23;
+        color: white;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    #SettingsDialog QTabWidget::pane {
+        border: none;
+        background-color: #1A1C23;
+    }
+    #SettingsDialog QTabBar::tab {
+        background-color: #2B3142;
+        color: white;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+        min-width: 100px;
+        padding: 8px 16px;
+        margin-right: 4px;
+    }
+    #SettingsDialog QTabBar::tab:selected {
+        background-color: #E61B72;
+    }
+    #SettingsDialog QTabBar::tab:hover:!selected {
+        background-color: #363D51;
+    }
+    #SettingsDialog QLabel {
+        color: white;
+    }
+    #SettingsDialog QCheckBox {
+        color: white;
+    }
+    #SettingsDialog QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 3px;
+        background-color: #2B3142;
+    }
+    #SettingsDialog QCheckBox::indicator:checked {
+        background-color: #E61B72;
+    }
+"""
+
+# Settings dialog widgets, matched by object name
+_LINEEDIT_QSS = """
+    QLineEdit#modernEdit {
+        background-color: #2B3142;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 15px;
+        font-size: 14px;
+    }
+    QLineEdit#modernEdit:focus {
+        background-color: #323848;
+    }
+"""
+
+_BTN_QSS = """
+    QPushButton#modernBtn {
+        background-color: #2B3142;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-size: 14px;
+    }
+    QPushButton#modernBtn:hover {
+        background-color: #363D51;
+    }
+    QPushButton#modernBtn:pressed {
+        background-color: #222736;
+    }
+    QPushButton#modernBtn:disabled {
+        background-color: #232734;
+        color: #6D727E;
+    }
+"""
+
+_BTN_ACCENT_QSS = """
+    QPushButton#modernBtn[accent="true"] {
+        background-color: #E61B72;
+        font-weight: bold;
+    }
+    QPushButton#modernBtn[accent="true"]:hover {
+        background-color: #F32A81;
+    }
+    QPushButton#modernBtn[accent="true"]:pressed {
+        background-color: #D10A61;
+    }
+    QPushButton#modernBtn[accent="true"]:disabled {
+        background-color: #444B5A;
+        color: #8D93A0;
+    }
+"""
+
+THEME_QSS = _SETTINGS_DIALOG_QSS + _CHECKMARK_QSS + _LINEEDIT_QSS + _BTN_QSS + _BTN_ACCENT_QSS
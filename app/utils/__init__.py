@@ -5,9 +5,10 @@ Utility functions for Project Launcher.
 # This file makes the directory a proper Python package
 # It also serves as a central place to import and export utilities
 
-__all__ = ['setup_logging', 'setup_qt_webengine', 'ensure_directories']
+__all__ = ['setup_logging', 'setup_qt_webengine', 'ensure_directories', 'calculate_checksum', 'download_file', 'download_files_batch', 'extract_zip']
 
 # Import functions from modules
 from app.utils.logging_utils import setup_logging
 from app.utils.webengine_utils import setup_qt_webengine
-from app.utils.directory_utils import ensure_directories
\ No newline at end of file
+from app.utils.directory_utils import ensure_directories
+from app.utils.file_utils import calculate_checksum, download_file, download_files_batch, extract_zip
\ No newline at end of file
@@ -4,22 +4,37 @@ Directory utility functions for Project Launcher.
 
 import os
 import logging
+from pathlib import Path
+
+# Launcher data directory and the subdirectories it needs
+DATA_DIR = "data"
+DATA_SUBDIRECTORIES = ("minecraft", "modpacks", "temp", "logs", "cache")
+_DATA_PATHS = {name: str(Path(DATA_DIR, name)) for name in DATA_SUBDIRECTORIES}
+USER_HOME_DIR = str(Path.home() / ".minecraft_launcher")
+
+# Set once the directories exist, so later calls make no filesystem calls
+_dirs_ensured = False
 
 def ensure_directories():
     """Ensure required directories exist."""
-    directories = [
-        os.path.join("data"),
-        os.path.join("data", "minecraft"),
-        os.path.join("data", "modpacks"),
-        os.path.join("data", "temp"),
-        os.path.join("data", "logs"),
-        os.path.join("data", "cache")
-    ]
+    global _dirs_ensured
     
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
-        logging.debug(f"Ensured directory: {directory}")
+    if _dirs_ensured:
+        return
+        
+    os.makedirs(DATA_DIR, exist_ok=True)
+    
+    # One directory listing tells us which subdirectories are missing
+    with os.scandir(DATA_DIR) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+        
+    for name, directory in _DATA_PATHS.items():
+        if name not in existing:
+            os.makedirs(directory, exist_ok=True)
+            logging.debug(f"Created directory: {directory}")
     
     # Also create user home directory if needed
-    os.makedirs(os.path.expanduser("~/.minecraft_launcher"), exist_ok=True)
-    logging.debug("Ensured user home directory")
\ No newline at end of file
+    os.makedirs(USER_HOME_DIR, exist_ok=True)
+    logging.debug("Ensured user home directory")
+    
+    _dirs_ensured = True
@@ -0,0 +1,351 @@
+"""
+File utility functions for Project Launcher.
+"""
+
+import os
+import re
+import mmap
+import shutil
+import hashlib
+import logging
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Copy buffer for downloads and how often progress is reported
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PROGRESS_INTERVAL = 4 << 20
+
+# Archives with fewer files than this are extracted on the calling thread
+EXTRACT_PARALLEL_THRESHOLD = 64
+
+# Concurrent downloads in a batch, and pooled connections per host to match
+MAX_DOWNLOAD_WORKERS = 16
+
+# Shared session so downloads reuse keep-alive connections
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=MAX_DOWNLOAD_WORKERS, pool_maxsize=MAX_DOWNLOAD_WORKERS))
+_session.mount("https://", HTTPAdapter(pool_connections=MAX_DOWNLOAD_WORKERS, pool_maxsize=MAX_DOWNLOAD_WORKERS))
+
+class _ProgressWriter:
+    """File wrapper that reports download progress at coarse intervals."""
+    
+    def __init__(self, f, total_size, progress_callback, offset=0):
+        self._f = f
+        self._total_size = total_size
+        self._progress_callback = progress_callback
+        self._written = offset
+        self._next_report = offset + PROGRESS_INTERVAL
+        
+    def write(self, data):
+        written = self._f.write(data)
+        self._written += len(data)
+        
+        if self._written >= self._next_report:
+            self._next_report = self._written + PROGRESS_INTERVAL
+            self._progress_callback(self._written / self._total_size)
+            
+        return written
+
+def _fadvise(f, advice):
+    """Pass an access pattern hint for a whole file to the kernel, where supported.
+    
+    Args:
+        f: Open file object.
+        advice (str): Name of the os.POSIX_FADV_* constant.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-")
+
+def _discard_partial(part_path: str, validator_path: str):
+    """Remove a partial download and its validator."""
+    for path in (part_path, validator_path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _resume_state(part_path: str, validator_path: str, verified: bool) -> Tuple[int, Optional[str]]:
+    """Get the offset and If-Range validator to resume a partial download from.
+    
+    Args:
+        part_path (str): Partial download path.
+        validator_path (str): Path of the ETag or Last-Modified saved with it.
+        verified (bool): Whether the finished file is checked against a checksum,
+            which makes resuming safe even without a validator.
+        
+    Returns:
+        Tuple[int, Optional[str]]: Offset to resume from (0 to start over) and validator.
+    """
+    if not os.path.exists(part_path):
+        return 0, None
+        
+    validator = None
+    try:
+        with open(validator_path, "r", encoding="utf-8") as f:
+            validator = f.read().strip() or None
+    except OSError:
+        pass
+        
+    # Without a validator a changed remote file can't be detected, so only resume if checked later
+    if validator is None and not verified:
+        _discard_partial(part_path, validator_path)
+        return 0, None
+        
+    return os.path.getsize(part_path), validator
+
+def _save_validator(validator_path: str, headers):
+    """Save the strong ETag, or else Last-Modified, of a response for If-Range."""
+    validator = headers.get("ETag")
+    if not validator or validator.startswith("W/"):
+        validator = headers.get("Last-Modified")
+        
+    if validator:
+        with open(validator_path, "w", encoding="utf-8") as f:
+            f.write(validator)
+    else:
+        try:
+            os.remove(validator_path)
+        except OSError:
+            pass
+
+def download_file(url: str, target_path: str, progress_callback=None, expected_hash: Optional[str] = None,
+                  hash_algorithm: str = "sha256", headers: Optional[Dict[str, str]] = None) -> bool:
+    """Download file with progress reporting.
+    
+    The body is written to a .part file next to the target, which is kept
+    when a download fails so the next attempt can resume it with a Range
+    request. The response's ETag or Last-Modified is saved alongside and
+    sent as If-Range, so a file that changed in between is fetched whole.
+    
+    Args:
+        url (str): URL to download.
+        target_path (str): Path to save downloaded file.
+        progress_callback: Callback function for progress reporting.
+        expected_hash (str, optional): Expected checksum of the file. An existing
+            target that matches is not downloaded again.
+        hash_algorithm (str): Algorithm of expected_hash.
+        headers (Dict[str, str], optional): Extra request headers, such as Authorization.
+        
+    Returns:
+        bool: True if download was successful, False otherwise.
+    """
+    expected_hash = expected_hash.lower() if expected_hash else None
+    
+    if expected_hash and os.path.exists(target_path):
+        if calculate_checksum(target_path, hash_algorithm) == expected_hash:
+            logging.debug(f"{target_path} is up to date, skipping download")
+            if progress_callback:
+                progress_callback(1.0)
+            return True
+            
+    part_path = f"{target_path}.part"
+    validator_path = f"{part_path}.validator"
+    
+    try:
+        # Ensure target directory exists
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        
+        # A stale partial file is dropped and the download restarted, once
+        for _ in range(2):
+            offset, validator = _resume_state(part_path, validator_path, expected_hash is not None)
+            
+            # Byte ranges need an unencoded body
+            request_headers = dict(headers or {})
+            if offset:
+                request_headers.update({"Range": f"bytes={offset}-", "Accept-Encoding": "identity"})
+                if validator:
+                    request_headers["If-Range"] = validator
+                    
+            with _session.get(url, stream=True, headers=request_headers) as response:
+                # The partial file is already complete or stale; start over
+                if offset and response.status_code == 416:
+                    _discard_partial(part_path, validator_path)
+                    continue
+                    
+                response.raise_for_status()
+                
+                if response.status_code == 206:
+                    # Only append a range that starts exactly where the partial file ends
+                    match = _CONTENT_RANGE_RE.match(response.headers.get("Content-Range", ""))
+                    if not match or int(match.group(1)) != offset:
+                        _discard_partial(part_path, validator_path)
+                        continue
+                else:
+                    # A server that ignores Range, or a changed file, sends the whole file again
+                    offset = 0
+                    _save_validator(validator_path, response.headers)
+                    
+                # Get content length if available
+                content_length = int(response.headers.get('content-length', 0))
+                total_size = offset + content_length if content_length else 0
+                
+                # Copy the body in C with a large buffer
+                response.raw.decode_content = True
+                with open(part_path, 'ab' if offset else 'wb') as f:
+                    _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+                    
+                    dst = f
+                    if progress_callback and total_size > 0:
+                        dst = _ProgressWriter(f, total_size, progress_callback, offset)
+                    shutil.copyfileobj(response.raw, dst, DOWNLOAD_CHUNK_SIZE)
+                    
+                    # Large downloads shouldn't crowd other data out of the page cache
+                    f.flush()
+                    _fadvise(f, "POSIX_FADV_DONTNEED")
+                    
+            break
+        else:
+            logging.error(f"Failed to download {url}: server did not send a usable range")
+            return False
+            
+        if expected_hash and calculate_checksum(part_path, hash_algorithm) != expected_hash:
+            # A corrupt partial file can't be resumed, so drop it
+            _discard_partial(part_path, validator_path)
+            logging.error(f"Checksum mismatch for {url}")
+            return False
+            
+        os.replace(part_path, target_path)
+        _discard_partial(part_path, validator_path)
+        
+        if progress_callback:
+            progress_callback(1.0)  # 100% complete
+            
+        return True
+        
+    except Exception as e:
+        logging.error(f"Failed to download {url}: {e}")
+        return False
+
+def calculate_checksum(file_path: str, algorithm: str = "sha256") -> Optional[str]:
+    """Calculate file checksum.
+    
+    Args:
+        file_path (str): Path to file.
+        algorithm (str): Hash algorithm to use.
+        
+    Returns:
+        Optional[str]: Calculated checksum or None if error.
+    """
+    algorithm = algorithm.lower()
+    
+    try:
+        hash_obj = hashlib.new(algorithm)
+    except ValueError:
+        logging.error(f"Unsupported hash algorithm: {algorithm}")
+        return None
+        
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            # Python 3.11+ hashes the file in a C loop
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, algorithm).hexdigest()
+                
+            # Otherwise hand the whole mapped file to the hash in one call
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hash_obj.update(mm)
+                    
+        return hash_obj.hexdigest()
+        
+    except Exception as e:
+        logging.error(f"Failed to calculate checksum for {file_path}: {e}")
+        return None
+
+def download_files_batch(items: Iterable[Tuple], hash_algorithm: str = "sha256", progress_callback=None) -> Dict[str, bool]:
+    """Download several files concurrently over the shared session.
+    
+    Args:
+        items (Iterable[Tuple]): (url, target_path) or (url, target_path, expected_hash) tuples.
+        hash_algorithm (str): Algorithm of the expected hashes.
+        progress_callback: Called on the calling thread with (completed, total)
+            as each download finishes.
+        
+    Returns:
+        Dict[str, bool]: Download success keyed by target path.
+    """
+    items = list(items)
+    if not items:
+        return {}
+        
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(items))) as executor:
+        futures = {
+            executor.submit(download_file, item[0], item[1], None, *item[2:], hash_algorithm=hash_algorithm): item[1]
+            for item in items
+        }
+        for completed, future in enumerate(as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress_callback:
+                progress_callback(completed, len(items))
+                
+    return results
+
+def extract_zip(zip_path: str, extract_path: str) -> bool:
+    """Extract ZIP file.
+    
+    Entries are decompressed on a thread pool; zlib releases the GIL while
+    inflating, and each worker reads through its own ZipFile handle.
+    
+    Args:
+        zip_path (str): Path to ZIP file.
+        extract_path (str): Path to extract to.
+        
+    Returns:
+        bool: True if extraction was successful, False otherwise.
+    """
+    try:
+        os.makedirs(extract_path, exist_ok=True)
+        root = os.path.abspath(extract_path)
+        
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            infos = [info for info in zip_ref.infolist() if not info.is_dir()]
+            
+            # Create the directory tree up front so workers don't race on makedirs
+            directories = set()
+            for info in zip_ref.infolist():
+                name = info.filename if info.is_dir() else os.path.dirname(info.filename)
+                directory = os.path.normpath(os.path.join(root, name))
+                # Entries pointing outside are left to ZipFile.extract, which sanitizes them
+                if os.path.commonpath([root, directory]) == root:
+                    directories.add(directory)
+            for directory in sorted(directories):
+                os.makedirs(directory, exist_ok=True)
+                
+            if len(infos) < EXTRACT_PARALLEL_THRESHOLD:
+                zip_ref.extractall(extract_path, infos)
+                return True
+                
+        handles = []
+        local = threading.local()
+        
+        def extract_member(info):
+            zip_handle = getattr(local, "zip_ref", None)
+            if zip_handle is None:
+                zip_handle = local.zip_ref = zipfile.ZipFile(zip_path, 'r')
+                handles.append(zip_handle)
+            zip_handle.extract(info, extract_path)
+            
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                # Consume the results so any extraction error is raised here
+                for _ in executor.map(extract_member, infos):
+                    pass
+        finally:
+            for zip_handle in handles:
+                zip_handle.close()
+            
+        return True
+        
+    except Exception as e:
+        logging.error(f"Failed to extract {zip_path}: {e}")
+        return False
@@ -1,6 +1,73 @@
 # filepath: c:\Users\benfo\Documents\Launcher\Project-Launcher\app\utils\java_utils.py
+import os
+import re
+import functools
 import shutil
+import subprocess
 
+_JAVA_VERSION_RE = re.compile(r'version "([^"]+)"')
+
+# Java versions by (resolved executable path, mtime), so an upgraded JDK is probed again
+_java_versions = {}
+
+@functools.lru_cache(maxsize=1)
 def is_java_installed():
-    """Check if Java is installed on the system."""
-    return shutil.which("java") is not None
\ No newline at end of file
+    """Check if Java is installed on the system.
+    
+    The PATH lookup is done once per process; shutil.which also honours
+    PATHEXT on Windows, so no platform branch or java -version run is needed.
+    """
+    return shutil.which("java") is not None
+
+def _read_release_version(java_exe):
+    """Read JAVA_VERSION from the release file of the JDK containing java_exe."""
+    directory = os.path.dirname(java_exe)
+    
+    # java is normally in <java home>/bin, but look a few levels up to be safe
+    for _ in range(3):
+        directory = os.path.dirname(directory)
+        release_path = os.path.join(directory, "release")
+        try:
+            with open(release_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("JAVA_VERSION="):
+                        return line.split("=", 1)[1].strip().strip('"')
+        except OSError:
+            continue
+            
+    return None
+
+def get_java_version():
+    """Get the version of the Java on PATH.
+    
+    Reads the JDK's release file where there is one, and only runs
+    java -version for runtimes without it.
+    
+    Returns:
+        str with the Java version, or None if Java is missing or unrecognised.
+    """
+    java_exe = shutil.which("java")
+    if java_exe is None:
+        return None
+        
+    java_exe = os.path.realpath(java_exe)
+    try:
+        key = (java_exe, os.stat(java_exe).st_mtime)
+    except OSError:
+        return None
+        
+    if key in _java_versions:
+        return _java_versions[key]
+        
+    version = _read_release_version(java_exe)
+    if version is None:
+        try:
+            result = subprocess.run([java_exe, "-version"], capture_output=True, text=True, check=False)
+            match = _JAVA_VERSION_RE.search(result.stderr)
+            if match:
+                version = match.group(1)
+        except OSError:
+            pass
+            
+    _java_versions[key] = version
+    return version
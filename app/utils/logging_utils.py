@@ -4,10 +4,12 @@ Logging utility functions for Project Launcher.
 
 import os
 import sys
+import queue
+import atexit
 import logging
 import platform
 import time
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener
 
 def setup_logging(log_level=logging.INFO):
     """Set up logging configuration.
@@ -15,20 +17,32 @@ def setup_logging(log_level=logging.INFO):
     Args:
         log_level: Logging level.
     """
+    # Only configure the root logger once per process
+    if logging.getLogger().handlers:
+        return
+        
     log_dir = os.path.join("data", "logs")
     os.makedirs(log_dir, exist_ok=True)
     
     log_file = os.path.join(log_dir, f"launcher_{time.strftime('%Y%m%d_%H%M%S')}.log")
     
-    # Configure logging
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    # Callers only enqueue records; formatting and writes happen on the listener thread
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    root.addHandler(QueueHandler(log_queue))
     
     logging.info(f"Logging to {log_file}")
     logging.info(f"System: {platform.system()} {platform.release()}")
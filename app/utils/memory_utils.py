@@ -1,13 +1,77 @@
 # filepath: c:\Users\benfo\Documents\Launcher\Project-Launcher\app\utils\memory_utils.py
 
+import os
+import re
+import sys
+import time
+from typing import Dict
+
 import psutil
 
+# Seconds a memory snapshot is reused for, so repeated dialog refreshes share one probe
+MEMORY_INFO_TTL = 5.0
+
+_memory_info_cache = (0.0, None)
+
+_MEMINFO_RE = re.compile(rb"MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)", re.S)
+
+def _read_proc_meminfo():
+    """Read total and available memory from /proc/meminfo.
+    
+    Returns:
+        dict with total and available memory in MB, or None if unavailable.
+    """
+    try:
+        fd = os.open("/proc/meminfo", os.O_RDONLY)
+        try:
+            buf = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+        
+    match = _MEMINFO_RE.search(buf)
+    if not match:
+        return None
+        
+    # Values are in kB
+    return {"total": int(match[1]) >> 10, "available": int(match[2]) >> 10}
+
 def get_memory_info():
     """Get total and available memory in MB."""
-    memory = psutil.virtual_memory()
-    return {"total": memory.total // (1024 * 1024), "available": memory.available // (1024 * 1024)}
+    global _memory_info_cache
+    
+    expiry, memory_info = _memory_info_cache
+    now = time.monotonic()
+    if memory_info is None or now >= expiry:
+        # On Linux only the two needed fields are pulled from /proc/meminfo
+        memory_info = _read_proc_meminfo() if sys.platform.startswith("linux") else None
+        if memory_info is None:
+            memory = psutil.virtual_memory()
+            memory_info = {"total": memory.total >> 20, "available": memory.available >> 20}
+        _memory_info_cache = (now + MEMORY_INFO_TTL, memory_info)
+        
+    return dict(memory_info)
 
-def calculate_recommended_memory():
-    """Calculate recommended memory allocation in MB."""
-    memory_info = get_memory_info()
-    return memory_info["available"] // 2  # Use half of available memory
\ No newline at end of file
+def calculate_recommended_memory(memory_info: Dict[str, int]) -> str:
+    """Calculate recommended memory allocation for Minecraft.
+    
+    Args:
+        memory_info (Dict[str, int]): Memory information from get_memory_info().
+        
+    Returns:
+        str: Recommended memory allocation in JVM format (e.g., "-Xmx4G").
+    """
+    total_mb = memory_info.get("total", 0)
+    available_mb = memory_info.get("available", 0)
+    
+    # Use the minimum of 75% of total or available memory
+    limit_mb = min((total_mb * 3) >> 2, available_mb)
+    
+    # Ensure minimum 1GB, maximum 16GB
+    limit_mb = max(1024, min(limit_mb, 16 * 1024))
+    
+    # Round to nearest GB
+    limit_gb = round(limit_mb / 1024)
+    
+    return f"-Xmx{limit_gb}G"
@@ -21,6 +21,7 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QSettings, QDir, QSize
 from PyQt6.QtGui import QIcon
 from app.ui.main_window import MainWindow
+from app.ui.theme import THEME_QSS
 from app.config import Config
 from app.utils import setup_logging, ensure_directories
 
@@ -58,6 +59,7 @@ def main():
    
     # Set application style
     app.setStyle("Fusion")
+    app.setStyleSheet(THEME_QSS)
     
     # Try to use .ico file first (better for Windows)
     icon_path_ico = os.path.abspath(os.path.join("app", "ui", "resources", "PL-logo.ico"))
@@ -6,23 +6,26 @@ Setup script for the Minecraft Modpack Launcher.
 """
 
 import os
+import re
 import sys
 import platform
-from setuptools import setup, find_packages
+from setuptools import setup, Command
+from setuptools.command.install_lib import install_lib
 
-# Get version from package
-sys.path.insert(0, os.path.abspath('.'))
-from app import __version__  # noqa
+# Commands whose output carries the long description
+DIST_COMMANDS = {'sdist', 'bdist', 'bdist_wheel', 'upload', 'register'}
 
-# Get long description from README
-with open('README.md', encoding='utf-8') as f:
-    long_description = f.read()
+# Host platform, looked up once
+_SYS = platform.system()
 
 # Additional options based on platform
 platform_specific = {}
 
-# PyInstaller spec file
-pyinstaller_spec = """
+# PyInstaller spec file, filled in with the platform's icon and extra sections.
+# Pure-Python modules are collected as loose .pyc files so the OS page cache can share them between launches.
+# One-folder output, so nothing is unpacked to a temp directory at launch.
+# UPX runs afterwards in parallel via `setup.py upx` rather than serially here.
+PYINSTALLER_SPEC_TEMPLATE = """
 # -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
@@ -32,15 +35,45 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=[
+        'PyQt6.sip',
+        'PyQt6.QtCore',
+        'PyQt6.QtGui',
+        'PyQt6.QtWidgets',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'PyQt6.QtQml',
+        'PyQt6.QtQuick',
+        'PyQt6.QtMultimedia',
+        'PyQt6.QtBluetooth',
+        'PyQt6.QtNfc',
+        'PyQt6.QtSql',
+        'PyQt6.QtTest',
+        'PyQt6.QtDBus',
+        'PyQt6.Qt3DCore',
+        'PyQt6.Qt3DRender',
+        'PyQt6.QtCharts',
+        'PyQt6.QtDataVisualization',
+        'tkinter',
+        'unittest',
+        'test',
+        'pydoc_data',
+        'distutils',
+        'lib2to3',
+        'xmlrpc',
+        'ensurepip',
+        'idlelib',
+        'turtle',
+        'turtledemo',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
-    noarchive=False,
+    noarchive=True,
+    optimize=2,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -48,92 +81,301 @@ pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='ProjectLauncher',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-"""
-
-# Platform-specific additions
-if platform.system() == "Windows":
-    pyinstaller_spec += """    icon='app/ui/resources/icon.ico',
+    icon='%(icon)s',
 )
-"""
-elif platform.system() == "Darwin":  # macOS
-    pyinstaller_spec += """    icon='app/ui/resources/icon.icns',
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='ProjectLauncher',
 )
+%(extra)s"""
 
+# Per-platform values for the spec template
+PYINSTALLER_SPEC_PLATFORM = {
+    "Windows": {
+        "icon": "app/ui/resources/icon.ico",
+        "extra": "",
+    },
+    "Darwin": {
+        "icon": "app/ui/resources/icon.icns",
+        "extra": """
 app = BUNDLE(
-    exe,
+    coll,
     name='ProjectLauncher.app',
     icon='app/ui/resources/icon.icns',
     bundle_identifier='com.yourcompany.projectlauncher',
 )
-"""
-else:  # Linux
-    pyinstaller_spec += """    icon='app/ui/resources/icon.png',
-)
-"""
+""",
+    },
+    "Linux": {
+        "icon": "app/ui/resources/icon.png",
+        "extra": "",
+    },
+}
+
+# Packages to install; app.core and app.ui have no __init__.py, so find_packages() would miss them
+PACKAGES = [
+    'app',
+    'app.auth',
+    'app.core',
+    'app.ui',
+    'app.utils',
+]
 
-# Write PyInstaller spec file
-with open('projectlauncher.spec', 'w') as spec_file:
-    spec_file.write(pyinstaller_spec)
-
-setup(
-    name="project-launcher",
-    version=__version__,
-    description="A lightweight, user-friendly Minecraft launcher with modpack management",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    author="Your Name",
-    author_email="your.email@example.com",
-    url="https://github.com/yourusername/project-launcher",
-    packages=find_packages(),
-    include_package_data=True,
-    entry_points={
-        "console_scripts": [
-            "projectlauncher=main:main",
+# Commands that build distributables and therefore need the spec file
+BUILD_COMMANDS = ('build', 'bdist', 'bdist_wheel', 'sdist', 'pyinstaller')
+
+SPEC_PATH = 'projectlauncher.spec'
+
+# PyInstaller one-folder output compressed by the upx command
+DIST_DIR = os.path.join('dist', 'ProjectLauncher')
+
+# Binary types worth packing
+UPX_SUFFIXES = ('.dll', '.pyd', '.exe', '.so')
+
+# UPX-packed Python and Qt runtime DLLs can fail to load, so they are left as is
+UPX_EXCLUDE = {
+    'python3.dll',
+    'vcruntime140.dll',
+    'qt6core.dll',
+    'qt6gui.dll',
+    'qt6widgets.dll',
+}
+
+
+def _emit_spec():
+    """Write the PyInstaller spec file unless it already has the same content."""
+    values = PYINSTALLER_SPEC_PLATFORM.get(_SYS, PYINSTALLER_SPEC_PLATFORM["Linux"])
+    spec = (PYINSTALLER_SPEC_TEMPLATE % values).encode('utf-8')
+    
+    # Leave an identical file untouched so its timestamp does not invalidate PyInstaller's build cache
+    if os.path.exists(SPEC_PATH):
+        with open(SPEC_PATH, 'rb') as spec_file:
+            if spec_file.read() == spec:
+                return
+                
+    with open(SPEC_PATH, 'wb') as spec_file:
+        spec_file.write(spec)
+
+
+class InstallLib(install_lib):
+    """install_lib that byte-compiles the installed modules in parallel."""
+    
+    def byte_compile(self, files):
+        # The stock implementation already warns and skips in these cases
+        if sys.dont_write_bytecode or self.dry_run:
+            return super().byte_compile(files)
+            
+        import subprocess
+        
+        # Same levels as install_lib, so get_outputs() reports every file written
+        levels = []
+        if self.compile:
+            levels.append(0)
+        if self.optimize > 0:
+            levels.append(self.optimize)
+            
+        py_files = [path for path in files if path.endswith('.py')]
+        if not levels or not py_files:
+            return
+            
+        args = [sys.executable, '-m', 'compileall', '-q', '-i', '-']
+        for level in levels:
+            args += ['-o', str(level)]
+        if self.force:
+            args.append('-f')
+        install_root = self.get_finalized_command('install').root
+        if install_root:
+            args += ['-s', install_root, '-p', os.sep]
+            
+        # Separate interpreters each compile a slice of the files. Unlike a process pool
+        # they never re-import this script, so no __main__ guard is needed under spawn.
+        workers = min(os.cpu_count() or 1, len(py_files))
+        processes = []
+        for index in range(workers):
+            process = subprocess.Popen(args, stdin=subprocess.PIPE, text=True)
+            process.stdin.write('\n'.join(py_files[index::workers]) + '\n')
+            process.stdin.close()
+            processes.append(process)
+            
+        for process in processes:
+            if process.wait() != 0:
+                self.warn("byte-compiling some installed modules failed")
+
+
+class UpxCommand(Command):
+    """Compress the PyInstaller output with UPX, one process per binary."""
+    
+    description = "UPX-compress the PyInstaller bundle in parallel"
+    user_options = []
+    
+    def initialize_options(self):
+        pass
+        
+    def finalize_options(self):
+        pass
+        
+    def run(self):
+        import shutil
+        import subprocess
+        from concurrent.futures import ThreadPoolExecutor
+        from distutils.errors import DistutilsExecError
+        
+        upx = shutil.which('upx')
+        if upx is None:
+            raise DistutilsExecError("upx was not found on PATH; install UPX to compress the bundle")
+            
+        targets = []
+        for root, _, files in os.walk(DIST_DIR):
+            for name in files:
+                if name.lower().endswith(UPX_SUFFIXES) and name.lower() not in UPX_EXCLUDE:
+                    targets.append(os.path.join(root, name))
+                    
+        if not targets:
+            print(f"No binaries to compress under {DIST_DIR}")
+            return
+            
+        # Each upx process is CPU-bound on its own, so threads only need to wait on them
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(
+                lambda path: subprocess.run([upx, '--best', '--lzma', '-q', path], capture_output=True),
+                targets,
+            ))
+            
+        packed = sum(1 for result in results if result.returncode == 0)
+        print(f"UPX compressed {packed} of {len(targets)} binaries")
+
+
+class BuildNuitka(Command):
+    """Compile the launcher to a standalone folder with Nuitka instead of PyInstaller."""
+    
+    description = "build a standalone executable with Nuitka"
+    user_options = []
+    
+    def initialize_options(self):
+        pass
+        
+    def finalize_options(self):
+        pass
+        
+    def run(self):
+        import subprocess
+        
+        # Standalone folder rather than onefile, so nothing is unpacked to a temp directory at launch
+        subprocess.check_call([
+            sys.executable, '-m', 'nuitka',
+            '--standalone',
+            '--lto=yes',
+            '--python-flag=-O',
+            '--enable-plugin=pyqt6',
+            '--include-package=app',
+            '--output-dir=dist',
+            'main.py',
+        ])
+
+
+def _read_version():
+    """Get the version from the package source without importing it."""
+    with open(os.path.join('app', '__init__.py'), encoding='utf-8') as f:
+        return re.search(r'^__version__\s*=\s*["\']([^"\']+)', f.read(), re.M).group(1)
+        
+
+def _read_long_description():
+    """Get the long description from README, only when building a distribution."""
+    if not DIST_COMMANDS & set(sys.argv):
+        return ''
+        
+    with open('README.md', encoding='utf-8') as f:
+        return f.read()
+        
+
+def main():
+    """Emit the spec file if needed and run setup()."""
+    # Only build commands need the spec; metadata queries skip the write
+    if any(cmd in sys.argv for cmd in BUILD_COMMANDS):
+        _emit_spec()
+    
+    setup(
+        name="project-launcher",
+        version=_read_version(),
+        description="A lightweight, user-friendly Minecraft launcher with modpack management",
+        long_description=_read_long_description(),
+        long_description_content_type="text/markdown",
+        author="Your Name",
+        author_email="your.email@example.com",
+        url="https://github.com/yourusername/project-launcher",
+        packages=PACKAGES,
+        include_package_data=True,
+        zip_safe=False,
+        cmdclass={
+            "install_lib": InstallLib,
+            "upx": UpxCommand,
+            "build_nuitka": BuildNuitka,
+        },
+        entry_points={
+            "console_scripts": [
+                "projectlauncher=main:main",
+            ],
+        },
+        classifiers=[
+            "Development Status :: 3 - Alpha",
+            "Intended Audience :: End Users/Desktop",
+            "Topic :: Games/Entertainment",
+            "License :: OSI Approved :: MIT License",
+            "Programming Language :: Python :: 3",
+            "Programming Language :: Python :: 3.9",
+            "Programming Language :: Python :: 3.10",
+            "Programming Language :: Python :: 3.11",
+            "Operating System :: OS Independent",
         ],
-    },
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: End Users/Desktop",
-        "Topic :: Games/Entertainment",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Operating System :: OS Independent",
-    ],
-    python_requires=">=3.9",
-    install_requires=[
-        "PyQt6>=6.5.0",
-        "requests>=2.30.0",
-        "jsonschema>=4.17.3",
-        "pillow>=9.5.0",
-    ],
-    extras_require={
-        "dev": [
-            "pytest>=7.0.0",
-            "pytest-cov>=4.0.0",
-            "flake8>=6.0.0",
-            "black>=23.0.0",
-            "pyinstaller>=5.10.0",
+        python_requires=">=3.9",
+        install_requires=[
+            "PyQt6>=6.5.0",
+            "PyQt6-WebEngine>=6.5.0",
+            "requests>=2.30.0",
+            "msal>=1.32.0",
+            "psutil>=5.9.0",
         ],
-    },
-    **platform_specific,
-)
\ No newline at end of file
+        extras_require={
+            "validate": [
+                "jsonschema>=4.17.3",
+            ],
+            "images": [
+                "pillow>=9.5.0",
+            ],
+            "full": [
+                "jsonschema>=4.17.3",
+                "pillow>=9.5.0",
+            ],
+            "dev": [
+                "pytest>=7.0.0",
+                "pytest-cov>=4.0.0",
+                "flake8>=6.0.0",
+                "black>=23.0.0",
+                "pyinstaller>=6.6.0",
+            ],
+        },
+        **platform_specific,
+    )
+
+
+if __name__ == '__main__':
+    main()